@@ -3,11 +3,17 @@ Citation handling for extracted KPIs.
 Provides deterministic citation tracking with document, page, and text span information.
 """
 
-from typing import Optional
-from pydantic import BaseModel
+from types import MappingProxyType
+from dataclasses import dataclass
+from typing import Mapping, Optional
 
+# Upper bound on a citation preview, so a match spanning a long stretch of a
+# filing does not pin a large copy of it in every Citation kept in memory
+MAX_PREVIEW_CHARS = 240
 
-class Citation(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class Citation:
     """Citation structure for extracted KPI values."""
 
     doc_id: str
@@ -15,6 +21,11 @@ class Citation(BaseModel):
     span: tuple[int, int]  # character positions [start, end]
     text_preview: str
 
+    def __post_init__(self) -> None:
+        # Accept any (start, end) sequence, e.g. a JSON list
+        if not isinstance(self.span, tuple):
+            object.__setattr__(self, 'span', tuple(self.span))
+
     def __str__(self) -> str:
         """String representation for display."""
         return f"{self.doc_id} (p.{self.page}): {self.text_preview[:50]}..."
@@ -43,8 +54,12 @@ class CitationManager:
         """Get citation for a specific KPI."""
         return self._citations.get(kpi_key)
 
-    def get_all_citations(self) -> dict[str, Citation]:
-        """Get all citations."""
+    def get_all_citations(self) -> Mapping[str, Citation]:
+        """Get a read-only view of all citations."""
+        return MappingProxyType(self._citations)
+
+    def snapshot(self) -> dict[str, Citation]:
+        """Get a mutable copy of all citations."""
         return self._citations.copy()
 
     def clear(self) -> None:
@@ -72,16 +87,26 @@ def create_citation_from_match(
         context_chars: Number of characters to include in preview
 
     Returns:
-        Citation object with preview text
+        Citation object with preview text. The preview is capped at
+        MAX_PREVIEW_CHARS; for a longer match it keeps the start of the match
+        and the span end is clamped to the preview.
     """
     # Extract preview with context around the match
-    preview_start = max(0, start_pos - context_chars // 2)
-    preview_end = min(len(text), end_pos + context_chars // 2)
+    preview_start = max(0, start_pos - min(context_chars, MAX_PREVIEW_CHARS) // 2)
+
+    # Trim surrounding whitespace by narrowing the window (never into the match),
+    # so only one context-sized slice of the document is copied
+    while preview_start < start_pos and text[preview_start].isspace():
+        preview_start += 1
+
+    preview_end = min(len(text), end_pos + context_chars // 2, preview_start + MAX_PREVIEW_CHARS)
+    while preview_end > end_pos and text[preview_end - 1].isspace():
+        preview_end -= 1
 
-    preview = text[preview_start:preview_end].strip()
+    preview = text[preview_start:preview_end]
 
     # Adjust span relative to preview
-    adjusted_span = (start_pos - preview_start, end_pos - preview_start)
+    adjusted_span = (start_pos - preview_start, min(end_pos, preview_end) - preview_start)
 
     return Citation(
         doc_id=doc_id,
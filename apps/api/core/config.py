@@ -4,10 +4,17 @@ Provides consistent financial inputs across all application components
 """
 
 import yaml
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from pydantic import BaseModel
 
+# Prefer the libyaml-backed loader when available (same output, much faster parse)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML keyed by (resolved path, mtime_ns, size); edits to the file produce a new key
+_YAML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
 class FinancialData(BaseModel):
     """PPL Corporation financial data structure"""
     ebitda: float
@@ -49,41 +56,52 @@ class FinancialConfig:
     Loads data from YAML and provides consistent access across components.
     """
 
+    _CACHED_MODELS = ('financial_data', 'market_assumptions', 'capital_structure', 'simulation_defaults')
+
     def __init__(self, config_path: Path = None):
         if config_path is None:
             # Default path relative to this file
             config_path = Path(__file__).parent.parent / "data" / "default_financial_inputs.yaml"
 
-        self.config_path = config_path
+        self.config_path = Path(config_path)
         self._config = None
         self._load_config()
 
     def _load_config(self) -> None:
-        """Load configuration from YAML file"""
+        """Load configuration from YAML file (parsed once per file version)"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f)
+            st = self.config_path.stat()
+            key = (str(self.config_path.resolve()), st.st_mtime_ns, st.st_size)
+            cached = _YAML_CACHE.get(key)
+            if cached is None:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    cached = yaml.load(f, Loader=_YAML_LOADER)
+                _YAML_CACHE[key] = cached
+            self._config = cached
+            # Drop memoized models so they are rebuilt from the (re)loaded config
+            for name in self._CACHED_MODELS:
+                self.__dict__.pop(name, None)
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing configuration file: {e}")
 
-    @property
+    @cached_property
     def financial_data(self) -> FinancialData:
         """Get PPL financial data"""
         return FinancialData(**self._config['ppl_financial_data'])
 
-    @property
+    @cached_property
     def market_assumptions(self) -> MarketAssumptions:
         """Get market assumptions"""
         return MarketAssumptions(**self._config['market_assumptions'])
 
-    @property
+    @cached_property
     def capital_structure(self) -> CapitalStructure:
         """Get capital structure"""
         return CapitalStructure(**self._config['capital_structure'])
 
-    @property
+    @cached_property
     def simulation_defaults(self) -> SimulationDefaults:
         """Get simulation defaults"""
         return SimulationDefaults(**self._config['simulation_defaults'])
@@ -132,28 +150,29 @@ class FinancialConfig:
         issues = []
         warnings = []
 
-        financial = self.financial_data
-        capital = self.capital_structure
+        # Scalar checks only: read the parsed YAML directly rather than building models
+        financial = self._config['ppl_financial_data']
+        capital = self._config['capital_structure']
 
         # Check capital structure consistency
-        total_weight = capital.debt_weight + capital.equity_weight
+        total_weight = capital['debt_weight'] + capital['equity_weight']
         if abs(total_weight - 1.0) > 0.01:
             issues.append(f"Capital structure weights don't sum to 1.0: {total_weight}")
 
         # Check debt-to-equity ratio consistency
-        calculated_debt_weight = financial.net_debt / (financial.net_debt + financial.shareholder_equity)
-        if abs(calculated_debt_weight - capital.debt_weight) > 0.01:
-            warnings.append(f"Debt weight mismatch: calculated {calculated_debt_weight:.2f}, configured {capital.debt_weight:.2f}")
+        calculated_debt_weight = financial['net_debt'] / (financial['net_debt'] + financial['shareholder_equity'])
+        if abs(calculated_debt_weight - capital['debt_weight']) > 0.01:
+            warnings.append(f"Debt weight mismatch: calculated {calculated_debt_weight:.2f}, configured {capital['debt_weight']:.2f}")
 
         # Check EBITDA coverage of interest
-        interest_coverage = (financial.ebitda / financial.interest_expense
-                             if financial.interest_expense else float('inf'))
+        interest_coverage = (financial['ebitda'] / financial['interest_expense']
+                             if financial['interest_expense'] else float('inf'))
         if interest_coverage < 3:
             warnings.append(f"Low interest coverage: {interest_coverage:.1f}x (< 3x)")
 
         # Check maintenance capex as percentage of EBITDA
-        capex_ratio = (financial.maintenance_capex / financial.ebitda
-                       if financial.ebitda else 0.0)
+        capex_ratio = (financial['maintenance_capex'] / financial['ebitda']
+                       if financial['ebitda'] else 0.0)
         if capex_ratio > 0.15:  # More than 15% of EBITDA
             warnings.append(f"High maintenance capex ratio: {capex_ratio:.1%} (> 15%)")
 
@@ -162,8 +181,8 @@ class FinancialConfig:
             'issues': issues,
             'warnings': warnings,
             'metrics': {
-                'total_capital': financial.net_debt + financial.shareholder_equity,
-                'debt_to_equity': financial.net_debt / financial.shareholder_equity,
+                'total_capital': financial['net_debt'] + financial['shareholder_equity'],
+                'debt_to_equity': financial['net_debt'] / financial['shareholder_equity'],
                 'interest_coverage': interest_coverage,
                 'capex_ratio': capex_ratio
             }
@@ -4,23 +4,68 @@ Manages automatic updates of financial data from latest SEC filings
 Integrates with existing configuration and KPI extraction systems
 """
 
+import asyncio
+import hashlib
 import json
 import logging
+import os
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple
+from dataclasses import asdict, dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 
-from .edgar_client import SECEdgarClient, get_sec_client
+# JSON backend is chosen once at import; both variants read and write UTF-8 bytes
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        # orjson serializes the FilingMetadata dataclasses natively
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional fast path
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=asdict).encode('utf-8')
+
+    _loads = json.loads
+
+from .edgar_client import SECEdgarClient, _extract_mdna, get_sec_client
 from .xbrl_client import XBRLClient, parse_core_metrics, parse_core_metrics_with_meta
 from .extract import KPIExtractor
 from .config import FinancialConfig
 
+if TYPE_CHECKING:
+    import httpx
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# KPIs a filing must yield for its data to count as complete
+_REQUIRED_METRICS = frozenset({'EBITDA', 'NetDebt', 'NetIncome'})
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp; the same filing/update dates recur across calls"""
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=4)
+def _worker_extractor(mappings_path: str) -> KPIExtractor:
+    """Build the KPI extractor once per worker process"""
+    return KPIExtractor(Path(mappings_path))
+
+
+def _extract_worker(mappings_path: str, content: str, ticker: str, doc_id: str) -> Dict[str, Any]:
+    """Extract KPIs from filing text inside an extraction worker process"""
+    return _worker_extractor(mappings_path).extract_from_text(content, ticker, doc_id)
+
+@dataclass(slots=True)
 class FilingMetadata:
     """Metadata for a SEC filing"""
     ticker: str
@@ -29,8 +74,9 @@ class FilingMetadata:
     accession_number: str
     last_updated: str
     data_quality: str  # 'excellent', 'good', 'fair', 'poor'
+    last_updated_ts: float = 0.0  # epoch seconds of last_updated, for cheap age checks
 
-@dataclass
+@dataclass(slots=True)
 class DataUpdateResult:
     """Result of a data update operation"""
     ticker: str
@@ -46,6 +92,14 @@ class SECDataManager:
     Provides automated retrieval, validation, and integration of latest filings
     """
 
+    # Concurrent ticker updates; SEC pacing is enforced by the EDGAR client's rate limiter
+    MAX_WORKERS = 4
+    # In-flight tickers for the async batch update
+    ASYNC_CONCURRENCY = 10
+
+    # How long a resolved latest filing and its text are reused across calls (seconds)
+    LATEST_FILING_TTL = 900
+
     def __init__(self, data_dir: Path = None, user_agent: str = None):
         """
         Initialize data manager
@@ -65,56 +119,181 @@ class SECDataManager:
         # Initialize SEC client
         if user_agent is None:
             user_agent = "EnergyICCopilot/1.0 (admin@energyiccopilot.com)"
-        self.sec_client = get_sec_client(user_agent)
-        self.xbrl_client = XBRLClient(user_agent)
+        # Response caches live under the data dir alongside the filings they describe
+        self.sec_client = get_sec_client(user_agent, cache_dir=data_dir / "edgar_cache")
+        self.xbrl_client = XBRLClient(user_agent, cache_dir=data_dir / "xbrl_cache")
 
         # Initialize KPI extractor
         mappings_path = data_dir / "mappings.yaml"
+        self.mappings_path = mappings_path
         if mappings_path.exists():
+            # Digest of the patterns the extractor was built from; KPI sidecars
+            # written under other mappings are re-extracted
+            self.mappings_digest = hashlib.sha256(mappings_path.read_bytes()).hexdigest()
             self.kpi_extractor = KPIExtractor(mappings_path)
         else:
+            self.mappings_digest = None
             self.kpi_extractor = None
             logger.warning("KPI mappings file not found")
 
         # Load existing metadata
         self.metadata = self._load_metadata()
+        if self._backfill_timestamps():
+            self._save_metadata()
+        # Guards metadata updates and saves when tickers are updated concurrently
+        self._metadata_lock = threading.Lock()
+        # ticker -> (monotonic timestamp, latest filing, filing text)
+        self._latest_filings: Dict[str, Tuple[float, Dict[str, Any], str]] = {}
+        # Worker processes for CPU-bound KPI extraction, only alive during batch updates
+        self._extract_pool: Optional[ProcessPoolExecutor] = None
 
     def _load_metadata(self) -> Dict[str, FilingMetadata]:
         """Load filing metadata from JSON file"""
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r') as f:
-                    data = json.load(f)
-                    return {
-                        ticker: FilingMetadata(**meta)
-                        for ticker, meta in data.items()
-                    }
+                data = _loads(self.metadata_file.read_bytes())
+                return {
+                    ticker: FilingMetadata(**meta)
+                    for ticker, meta in data.items()
+                }
             except Exception as e:
                 logger.error(f"Failed to load metadata: {e}")
 
         return {}
 
+    def _backfill_timestamps(self) -> bool:
+        """Fill last_updated_ts from the ISO string for entries saved before it existed"""
+        changed = False
+        for meta in self.metadata.values():
+            if not meta.last_updated_ts:
+                try:
+                    meta.last_updated_ts = _parse_iso(meta.last_updated).timestamp()
+                    changed = True
+                except (TypeError, ValueError):
+                    pass  # left at 0.0, i.e. treated as stale
+        return changed
+
     def _save_metadata(self):
         """Save filing metadata to JSON file"""
         try:
-            data = {
-                ticker: {
-                    'ticker': meta.ticker,
-                    'form_type': meta.form_type,
-                    'filing_date': meta.filing_date,
-                    'accession_number': meta.accession_number,
-                    'last_updated': meta.last_updated,
-                    'data_quality': meta.data_quality
-                }
-                for ticker, meta in self.metadata.items()
-            }
-
-            with open(self.metadata_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            self.metadata_file.write_bytes(_dumps(self.metadata))
 
         except Exception as e:
             logger.error(f"Failed to save metadata: {e}")
 
+    def _fetch_latest_filing(self, ticker: str, refresh: bool = False) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Resolve the latest periodic filing (10-Q or 10-K) and its text, preferring the MD&A section
+
+        Successful lookups are reused for LATEST_FILING_TTL seconds, so an update followed
+        by a read of the same ticker does not repeat the SEC round-trips.
+
+        Args:
+            ticker: Company ticker symbol
+            refresh: Ignore any cached result
+
+        Returns:
+            (filing metadata, filing text); text is None if the download failed and
+            both are None if no filing was found
+        """
+        cached = self._latest_filings.get(ticker)
+        if cached and not refresh and time.monotonic() - cached[0] < self.LATEST_FILING_TTL:
+            return cached[1], cached[2]
+
+        filing = self.sec_client.get_latest_periodic(ticker)
+        if not filing:
+            return None, None
+
+        content = self.sec_client.get_filing_content(filing['accession_number'], filing['primary_document'])
+        if not content:
+            return filing, None
+
+        return filing, self._remember_latest(ticker, filing, content)
+
+    async def _afetch_latest_filing(self, ticker: str, http: "httpx.AsyncClient",
+                                    refresh: bool = False) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Async variant of _fetch_latest_filing; shares its cache"""
+        cached = self._latest_filings.get(ticker)
+        if cached and not refresh and time.monotonic() - cached[0] < self.LATEST_FILING_TTL:
+            return cached[1], cached[2]
+
+        filing = await self.sec_client.aget_latest_periodic(ticker, http)
+        if not filing:
+            return None, None
+
+        content = await self.sec_client.aget_filing_content(
+            filing['accession_number'], filing['primary_document'], http
+        )
+        if not content:
+            return filing, None
+
+        return filing, await asyncio.to_thread(self._remember_latest, ticker, filing, content)
+
+    def _remember_latest(self, ticker: str, filing: Dict[str, Any], content: str) -> str:
+        """Cache a freshly fetched filing with its MD&A section (or full text if none is found)"""
+        section = _extract_mdna(content)
+        text = section if section is not None else content
+        self._latest_filings[ticker] = (time.monotonic(), filing, text)
+        return text
+
+    def _extract_kpis(self, content: str, ticker: str, doc_id: str) -> Dict[str, Any]:
+        """
+        Extract KPIs from filing text, in a worker process when a batch pool is active
+
+        Regex extraction over a full filing is CPU-bound, so running it in the update
+        threads would serialize on the GIL; worker processes let it scale across cores.
+        """
+        pool = self._extract_pool
+        if pool is None:
+            return self.kpi_extractor.extract_from_text(content, ticker, doc_id)
+        return pool.submit(_extract_worker, str(self.mappings_path), content, ticker, doc_id).result()
+
+    def _filing_kpis(self, ticker: str, accession_number: str, content: str,
+                     refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Serialized KPIs for a filing, read from a sidecar JSON cache when available
+
+        Filings are immutable per accession number, so a newer filing simply lands
+        under a different cache file. Each sidecar records the digest of the
+        mappings it was extracted with; after mappings.yaml changes, the stale
+        result is ignored and overwritten on the next read.
+
+        Args:
+            ticker: Company ticker symbol
+            accession_number: Filing accession number
+            content: Filing text to extract from on a cache miss
+            refresh: Re-extract and overwrite any cached result
+
+        Returns:
+            KPI name -> {'value', 'unit', 'citation'}
+        """
+        cache_path = self.filings_dir / f"{ticker}_{accession_number}.kpis.json"
+        if not refresh:
+            try:
+                cached = _loads(cache_path.read_bytes())
+            except FileNotFoundError:
+                cached = None
+            except ValueError as e:
+                cached = None
+                logger.warning(f"Ignoring unreadable KPI cache {cache_path}: {e}")
+            if isinstance(cached, dict) and cached.get('mappings') == self.mappings_digest:
+                return cached['kpis']
+
+        kpis = {
+            name: {
+                'value': kpi.value,
+                'unit': kpi.unit,
+                'citation': kpi.citation.to_dict()
+            }
+            for name, kpi in self._extract_kpis(content, ticker, accession_number).items()
+        }
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(_dumps({'mappings': self.mappings_digest, 'kpis': kpis}))
+        except OSError as e:
+            logger.warning(f"Could not write KPI cache {cache_path}: {e}")
+        return kpis
+
     def check_for_updates(self, ticker: str, days_threshold: int = 30) -> bool:
         """
         Check if a company's data needs updating
@@ -126,25 +305,25 @@ class SECDataManager:
         Returns:
             True if update is needed
         """
-        if ticker not in self.metadata:
-            return True
-
-        last_update = datetime.fromisoformat(self.metadata[ticker].last_updated)
-        days_since_update = (datetime.now() - last_update).days
+        meta = self.metadata.get(ticker)
+        return meta is None or time.time() - meta.last_updated_ts >= days_threshold * 86400.0
 
-        return days_since_update >= days_threshold
-
-    def update_company_data(self, ticker: str, force: bool = False) -> DataUpdateResult:
+    def update_company_data(self, ticker: str, force: bool = False, defer_save: bool = False) -> DataUpdateResult:
         """
         Update financial data for a specific company
 
         Args:
             ticker: Company ticker symbol
             force: Force update even if recent data exists
+            defer_save: Leave writing the metadata file to the caller (batch updates)
 
         Returns:
             Update result with success status and details
         """
+        # One timestamp for every result and metadata field this update produces
+        now = datetime.now()
+        now_iso = now.isoformat()
+
         try:
             logger.info(f"Updating data for {ticker}")
 
@@ -156,90 +335,121 @@ class SECDataManager:
                     filing_date=self.metadata[ticker].filing_date,
                     metrics_extracted=0,
                     error_message="Data is current",
-                    last_updated=datetime.now().isoformat()
+                    last_updated=now_iso
                 )
 
-            # Get latest filing from SEC
-            latest_filing = self.sec_client.get_latest_10q(ticker) or self.sec_client.get_latest_10k(ticker)
+            # Get latest filing and its text (MD&A section preferred for KPI accuracy)
+            latest_filing, content = self._fetch_latest_filing(ticker, refresh=force)
+            return self._apply_update(ticker, latest_filing, content, now, force, defer_save)
 
-            if not latest_filing:
-                return DataUpdateResult(
-                    ticker=ticker,
-                    success=False,
-                    filing_date=None,
-                    metrics_extracted=0,
-                    error_message="No recent filings found",
-                    last_updated=datetime.now().isoformat()
-                )
+        except Exception as e:
+            logger.error(f"Failed to update {ticker}: {e}")
+            return DataUpdateResult(
+                ticker=ticker,
+                success=False,
+                filing_date=None,
+                metrics_extracted=0,
+                error_message=str(e),
+                last_updated=now_iso
+            )
 
-            # Download filing content (prefer MD&A section for KPI accuracy)
-            content = self.sec_client.get_latest_mdna(ticker)
-            if not content:
-                content = self.sec_client.get_filing_content(
-                    latest_filing['accession_number'],
-                    latest_filing['primary_document']
-                )
+    async def aupdate_company_data(self, ticker: str, http: "httpx.AsyncClient", force: bool = False,
+                                   defer_save: bool = False) -> DataUpdateResult:
+        """
+        Async variant of update_company_data
+
+        SEC requests go through the shared httpx.AsyncClient on the event loop; KPI
+        extraction and the metadata write run in a worker thread.
+        """
+        now = datetime.now()
+        now_iso = now.isoformat()
+
+        try:
+            logger.info(f"Updating data for {ticker}")
 
-            if not content:
+            if not force and not self.check_for_updates(ticker):
                 return DataUpdateResult(
                     ticker=ticker,
-                    success=False,
-                    filing_date=latest_filing['filing_date'],
+                    success=True,
+                    filing_date=self.metadata[ticker].filing_date,
                     metrics_extracted=0,
-                    error_message="Failed to download filing content",
-                    last_updated=datetime.now().isoformat()
+                    error_message="Data is current",
+                    last_updated=now_iso
                 )
 
-            # Extract KPIs if extractor is available
-            metrics_extracted = 0
-            if self.kpi_extractor:
-                try:
-                    # Save content to temporary file for extraction
-                    temp_file = self.filings_dir / f"{ticker.lower()}_temp.txt"
-                    with open(temp_file, 'w', encoding='utf-8') as f:
-                        f.write(content)
-
-                    kpis = self.kpi_extractor.extract_from_file(temp_file, ticker)
-                    metrics_extracted = len(kpis)
+            latest_filing, content = await self._afetch_latest_filing(ticker, http, refresh=force)
+            return await asyncio.to_thread(self._apply_update, ticker, latest_filing, content, now, force, defer_save)
 
-                    # Clean up temp file
-                    temp_file.unlink(missing_ok=True)
-
-                except Exception as e:
-                    logger.warning(f"KPI extraction failed for {ticker}: {e}")
-
-            # Update metadata
-            self.metadata[ticker] = FilingMetadata(
+        except Exception as e:
+            logger.error(f"Failed to update {ticker}: {e}")
+            return DataUpdateResult(
                 ticker=ticker,
-                form_type=latest_filing['form_type'],
-                filing_date=latest_filing['filing_date'],
-                accession_number=latest_filing['accession_number'],
-                last_updated=datetime.now().isoformat(),
-                data_quality='excellent' if metrics_extracted > 5 else 'good'
+                success=False,
+                filing_date=None,
+                metrics_extracted=0,
+                error_message=str(e),
+                last_updated=now_iso
             )
 
-            self._save_metadata()
+    def _apply_update(self, ticker: str, latest_filing: Optional[Dict[str, Any]], content: Optional[str],
+                      now: datetime, force: bool, defer_save: bool) -> DataUpdateResult:
+        """Extract KPIs from a fetched filing and record it in the metadata"""
+        now_iso = now.isoformat()
 
+        if not latest_filing:
             return DataUpdateResult(
                 ticker=ticker,
-                success=True,
-                filing_date=latest_filing['filing_date'],
-                metrics_extracted=metrics_extracted,
-                error_message=None,
-                last_updated=datetime.now().isoformat()
+                success=False,
+                filing_date=None,
+                metrics_extracted=0,
+                error_message="No recent filings found",
+                last_updated=now_iso
             )
 
-        except Exception as e:
-            logger.error(f"Failed to update {ticker}: {e}")
+        if not content:
             return DataUpdateResult(
                 ticker=ticker,
                 success=False,
-                filing_date=None,
+                filing_date=latest_filing['filing_date'],
                 metrics_extracted=0,
-                error_message=str(e),
-                last_updated=datetime.now().isoformat()
+                error_message="Failed to download filing content",
+                last_updated=now_iso
             )
 
+        # Extract KPIs if extractor is available
+        metrics_extracted = 0
+        if self.kpi_extractor:
+            try:
+                kpis = self._filing_kpis(ticker, latest_filing['accession_number'], content, refresh=force)
+                metrics_extracted = len(kpis)
+
+            except Exception as e:
+                logger.warning(f"KPI extraction failed for {ticker}: {e}")
+
+        # Update metadata
+        with self._metadata_lock:
+            self.metadata[ticker] = FilingMetadata(
+                ticker=ticker,
+                form_type=latest_filing['form_type'],
+                filing_date=latest_filing['filing_date'],
+                accession_number=latest_filing['accession_number'],
+                last_updated=now_iso,
+                data_quality='excellent' if metrics_extracted > 5 else 'good',
+                last_updated_ts=now.timestamp()
+            )
+
+            if not defer_save:
+                self._save_metadata()
+
+        return DataUpdateResult(
+            ticker=ticker,
+            success=True,
+            filing_date=latest_filing['filing_date'],
+            metrics_extracted=metrics_extracted,
+            error_message=None,
+            last_updated=now_iso
+        )
+
     def update_all_companies(self, force: bool = False) -> List[DataUpdateResult]:
         """
         Update financial data for all tracked companies
@@ -250,17 +460,29 @@ class SECDataManager:
         Returns:
             List of update results
         """
-        results = []
+        tickers = list(self.sec_client.company_ciks)
+
+        # Tickers are I/O bound (SEC HTTP + disk), so update them concurrently; the EDGAR
+        # client's shared rate limiter keeps the combined request rate within SEC limits,
+        # while KPI extraction is handed to worker processes so it is not GIL-bound
+        # Metadata is written once at the end (even if interrupted) rather than per ticker
+        if self.kpi_extractor and len(tickers) > 1:
+            self._extract_pool = ProcessPoolExecutor(max_workers=min(len(tickers), os.cpu_count() or 1))
+        try:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                futures = [executor.submit(self.update_company_data, ticker, force, defer_save=True)
+                           for ticker in tickers]
+        finally:
+            if self._extract_pool is not None:
+                self._extract_pool.shutdown()
+                self._extract_pool = None
+            with self._metadata_lock:
+                self._save_metadata()
 
-        for ticker in self.sec_client.company_ciks.keys():
+        results = []
+        for ticker, future in zip(tickers, futures):
             try:
-                result = self.update_company_data(ticker, force)
-                results.append(result)
-
-                # Small delay to respect SEC rate limits
-                import time
-                time.sleep(0.5)
-
+                results.append(future.result())
             except Exception as e:
                 logger.error(f"Error updating {ticker}: {e}")
                 results.append(DataUpdateResult(
@@ -274,41 +496,103 @@ class SECDataManager:
 
         return results
 
-    def get_data_status(self) -> Dict[str, Any]:
+    async def aupdate_all_companies(self, http: "httpx.AsyncClient", force: bool = False) -> List[DataUpdateResult]:
         """
-        Get comprehensive status of financial data
+        Async variant of update_all_companies
+
+        Runs every ticker on the event loop over a shared httpx.AsyncClient, with at most
+        ASYNC_CONCURRENCY in flight; KPI extraction still goes to worker processes.
+
+        Args:
+            http: Shared async HTTP client for SEC requests
+            force: Force update for all companies regardless of last update date
 
         Returns:
-            Dictionary with data status information
+            List of update results, in tracking order
+        """
+        tickers = list(self.sec_client.company_ciks)
+        semaphore = asyncio.Semaphore(self.ASYNC_CONCURRENCY)
+
+        async def update_one(ticker: str) -> DataUpdateResult:
+            async with semaphore:
+                return await self.aupdate_company_data(ticker, http, force, defer_save=True)
+
+        if self.kpi_extractor and len(tickers) > 1:
+            self._extract_pool = ProcessPoolExecutor(max_workers=min(len(tickers), os.cpu_count() or 1))
+        try:
+            outcomes = await asyncio.gather(*(update_one(t) for t in tickers), return_exceptions=True)
+        finally:
+            if self._extract_pool is not None:
+                self._extract_pool.shutdown()
+                self._extract_pool = None
+            with self._metadata_lock:
+                self._save_metadata()
+
+        results = []
+        for ticker, outcome in zip(tickers, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error updating {ticker}: {outcome}")
+                outcome = DataUpdateResult(
+                    ticker=ticker,
+                    success=False,
+                    filing_date=None,
+                    metrics_extracted=0,
+                    error_message=str(outcome),
+                    last_updated=datetime.now().isoformat()
+                )
+            results.append(outcome)
+
+        return results
+
+    def get_data_summary(self) -> Dict[str, Any]:
         """
-        status = {
+        Get headline data counts without building the per-company breakdown
+
+        Returns:
+            Dictionary with total and covered company counts
+        """
+        return {
             'total_companies': len(self.sec_client.company_ciks),
             'companies_with_data': len(self.metadata),
-            'last_update_check': datetime.now().isoformat(),
-            'companies': {}
+            'last_update_check': datetime.now().isoformat()
         }
 
-        for ticker in self.sec_client.company_ciks.keys():
-            if ticker in self.metadata:
-                meta = self.metadata[ticker]
-                days_since_update = (datetime.now() - datetime.fromisoformat(meta.last_updated)).days
-
-                status['companies'][ticker] = {
-                    'has_data': True,
-                    'filing_date': meta.filing_date,
-                    'form_type': meta.form_type,
-                    'last_updated': meta.last_updated,
-                    'days_since_update': days_since_update,
-                    'data_quality': meta.data_quality,
-                    'needs_update': days_since_update > 30
-                }
-            else:
-                status['companies'][ticker] = {
-                    'has_data': False,
-                    'needs_update': True
-                }
+    def get_data_status(self) -> Dict[str, Any]:
+        """
+        Get comprehensive status of financial data
 
-        return status
+        Returns:
+            Dictionary with data status information
+        """
+        now = datetime.now()
+        now_ts = now.timestamp()
+        metadata = self.metadata
+        companies = {}
+
+        # One metadata lookup per tracked ticker, in tracking order
+        for ticker in self.sec_client.company_ciks:
+            meta = metadata.get(ticker)
+            if meta is None:
+                companies[ticker] = {'has_data': False, 'needs_update': True}
+                continue
+
+            days_since_update = int((now_ts - meta.last_updated_ts) // 86400)
+            companies[ticker] = {
+                'has_data': True,
+                'filing_date': meta.filing_date,
+                'form_type': meta.form_type,
+                'last_updated': meta.last_updated,
+                'days_since_update': days_since_update,
+                'data_quality': meta.data_quality,
+                'needs_update': days_since_update > 30
+            }
+
+        return {
+            'total_companies': len(self.sec_client.company_ciks),
+            'companies_with_data': len(metadata),
+            'last_update_check': now.isoformat(),
+            'companies': companies
+        }
 
     def get_latest_financial_data(self, ticker: str) -> Optional[Dict[str, Any]]:
         """
@@ -324,43 +608,23 @@ class SECDataManager:
             return None
 
         try:
-            # Get latest filing
-            filing = self.sec_client.get_latest_10q(ticker) or self.sec_client.get_latest_10k(ticker)
+            # Get latest filing and its text (prefer MD&A)
+            filing, content = self._fetch_latest_filing(ticker)
 
             if not filing:
                 return None
 
-            # Get content and extract KPIs (prefer MD&A)
-            content = self.sec_client.get_latest_mdna(ticker)
-            if not content:
-                content = self.sec_client.get_filing_content(
-                    filing['accession_number'],
-                    filing['primary_document']
-                )
-
             if not content or not self.kpi_extractor:
                 return None
 
-            # Extract KPIs
-            temp_file = self.filings_dir / f"{ticker.lower()}_latest.txt"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            kpis = self.kpi_extractor.extract_from_file(temp_file, ticker)
-            temp_file.unlink(missing_ok=True)
+            # Extract KPIs (or reuse the sidecar cache for this accession)
+            kpis = self._filing_kpis(ticker, filing['accession_number'], content)
 
             return {
                 'ticker': ticker,
                 'filing_date': filing['filing_date'],
                 'form_type': filing['form_type'],
-                'kpis': {
-                    name: {
-                        'value': kpi.value,
-                        'unit': kpi.unit,
-                        'citation': kpi.citation.to_dict()
-                    }
-                    for name, kpi in kpis.items()
-                },
+                'kpis': kpis,
                 'extracted_at': datetime.now().isoformat()
             }
 
@@ -378,24 +642,44 @@ class SECDataManager:
                 return None
             cik = self.sec_client.company_ciks[ticker]
             facts = self.xbrl_client.get_company_facts(cik)
-            # Map period to frame preference for flow metrics
-            period_map = {"ytd": "YTD", "qtd": "QTD", "quarter": "QTD", "any": "ANY"}
-            flow_pref = period_map.get((period or "any").lower(), "ANY")
-            metrics, details = parse_core_metrics_with_meta(facts, flow_frame_pref=flow_pref)
+            return self._build_xbrl_result(ticker, cik, facts, period)
+        except Exception as e:
+            logger.error(f"XBRL fetch/parse failed for {ticker}: {e}")
+            return None
 
-            return {
-                'ticker': ticker,
-                'cik': cik,
-                'metrics_millions': metrics,
-                'source': 'SEC XBRL companyfacts',
-                'retrieved_at': datetime.now().isoformat(),
-                'facts_meta': details,
-                'period_preference': flow_pref
-            }
+    async def aget_latest_financials_xbrl(self, ticker: str, http: "httpx.AsyncClient",
+                                          period: str = "any") -> Optional[Dict[str, Any]]:
+        """
+        Async variant of get_latest_financials_xbrl that fetches companyfacts
+        over a shared httpx.AsyncClient; cache I/O and parsing run in worker threads.
+        """
+        try:
+            if ticker not in self.sec_client.company_ciks:
+                return None
+            cik = self.sec_client.company_ciks[ticker]
+            facts = await self.xbrl_client.aget_company_facts(cik, http)
+            return await asyncio.to_thread(self._build_xbrl_result, ticker, cik, facts, period)
         except Exception as e:
             logger.error(f"XBRL fetch/parse failed for {ticker}: {e}")
             return None
 
+    def _build_xbrl_result(self, ticker: str, cik: str, facts: Dict[str, Any], period: str) -> Dict[str, Any]:
+        """Parse companyfacts into the standardized XBRL response payload."""
+        # Map period to frame preference for flow metrics
+        period_map = {"ytd": "YTD", "qtd": "QTD", "quarter": "QTD", "any": "ANY"}
+        flow_pref = period_map.get((period or "any").lower(), "ANY")
+        metrics, details = parse_core_metrics_with_meta(facts, flow_frame_pref=flow_pref)
+
+        return {
+            'ticker': ticker,
+            'cik': cik,
+            'metrics_millions': metrics,
+            'source': 'SEC XBRL companyfacts',
+            'retrieved_at': datetime.now().isoformat(),
+            'facts_meta': details,
+            'period_preference': flow_pref
+        }
+
     def validate_data_quality(self, ticker: str) -> Dict[str, Any]:
         """
         Validate the quality of financial data for a company
@@ -426,14 +710,13 @@ class SECDataManager:
             quality_report['metrics']['total_kpis'] = len(kpis)
 
             # Check for key financial metrics
-            required_metrics = ['EBITDA', 'NetDebt', 'NetIncome']
-            found_metrics = sum(1 for metric in required_metrics if metric in kpis)
+            found_metrics = len(_REQUIRED_METRICS & kpis.keys())
 
             quality_report['metrics']['required_metrics_found'] = found_metrics
-            quality_report['metrics']['required_metrics_total'] = len(required_metrics)
+            quality_report['metrics']['required_metrics_total'] = len(_REQUIRED_METRICS)
 
             # Assess data completeness
-            if found_metrics == len(required_metrics):
+            if found_metrics == len(_REQUIRED_METRICS):
                 if len(kpis) >= 5:
                     quality_report['overall_quality'] = 'excellent'
                 else:
@@ -445,7 +728,7 @@ class SECDataManager:
                 quality_report['issues'].append('Missing key financial metrics')
 
             # Check data freshness
-            filing_date = datetime.fromisoformat(data['filing_date'])
+            filing_date = _parse_iso(data['filing_date'])
             days_old = (datetime.now() - filing_date).days
 
             if days_old > 90:
@@ -497,7 +780,7 @@ if __name__ == "__main__":
     print("=== SEC Data Manager Test ===")
 
     # Check data status
-    status = manager.get_data_status()
+    status = manager.get_data_summary()
     print(f"Total companies: {status['total_companies']}")
     print(f"Companies with data: {status['companies_with_data']}")
 
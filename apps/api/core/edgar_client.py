@@ -4,19 +4,164 @@ Provides automated retrieval of 10-K, 10-Q, and 8-K filings from SEC EDGAR datab
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+import gzip
 import json
+import os
 import time
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime, timedelta
 import re
 import logging
+from itertools import zip_longest
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast path
+    orjson = None
+
+try:  # urllib3 only decodes Brotli bodies when one of these is installed
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'gzip, br, deflate'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = 'gzip, br, deflate'
+    except ImportError:
+        _ACCEPT_ENCODING = 'gzip, deflate'
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # pragma: no cover - optional fast path
+    HTMLParser = None
+
+if TYPE_CHECKING:
+    import httpx
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for HTML cleaning and MD&A section detection
+_SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+_STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_MDA_HEADER_RE = re.compile(r'MANAGEMENT.?S DISCUSSION AND ANALYSIS|MD&A', re.IGNORECASE | re.DOTALL)
+_MDA_END_RE = re.compile(r'QUANTITATIVE AND QUALITATIVE|FINANCIAL STATEMENTS|CHANGES IN', re.IGNORECASE)
+
+# Maximum number of characters scanned for the end of the MD&A section
+MDA_WINDOW_CHARS = 500_000
+
+
+# Default location for on-disk EDGAR caches
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "edgar"
+
+# Chunk size used when streaming filing documents from EDGAR
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _write_chunked(f, text: str) -> None:
+    """Write text in _STREAM_CHUNK_SIZE slices so large filings are encoded incrementally"""
+    for start in range(0, len(text), _STREAM_CHUNK_SIZE):
+        f.write(text[start:start + _STREAM_CHUNK_SIZE])
+
+
+def _html_to_text(html: Union[str, bytes], encoding: Optional[str] = None) -> str:
+    """
+    Convert filing HTML to whitespace-normalized plain text
+
+    Uses selectolax's C parser (single tokenizer pass) when installed and
+    falls back to regex stripping otherwise. Raw bytes are handed to the
+    parser as-is so the document is only decoded once.
+    """
+    if HTMLParser is not None:
+        tree = HTMLParser(html)
+        for node in tree.css('script, style'):
+            node.decompose()
+        root = tree.body if tree.body is not None else tree.root
+        text = root.text(separator=' ') if root is not None else ''
+        return ' '.join(text.split())
+
+    if isinstance(html, bytes):
+        html = html.decode(encoding or 'utf-8', errors='replace')
+    content = _SCRIPT_RE.sub('', html)
+    content = _STYLE_RE.sub('', content)
+    content = _TAG_RE.sub(' ', content)
+    return _WS_RE.sub(' ', content).strip()
+
+# Company CIK mappings for energy infrastructure companies
+_COMPANY_CIKS = {
+    'PPL': '0000922224',   # Pembina Pipeline Corporation
+    'ENB': '0000895728',   # Enbridge Inc.
+    'TRP': '0000867962',   # TC Energy Corporation
+    'KEY': '0000315293',   # Keyera Corp.
+    'MMP': '0001126975',   # Magellan Midstream Partners, L.P.
+    'KMI': '0001506307',   # Kinder Morgan, Inc.
+    'OKE': '0001039684',   # ONEOK, Inc.
+    'WMB': '0000107263',   # The Williams Companies, Inc.
+    'ET': '0001276187',    # Energy Transfer LP
+    'TRGP': '0001389170'   # Targa Resources Corp.
+}
+
+
+def _date_window(dates: List[str], start_date: str, end_date: str) -> Tuple[int, int]:
+    """
+    Binary-search the [lo, hi) index range of ISO dates within [start_date, end_date]
+
+    EDGAR lists recent filings newest first, so ``dates`` is in descending order.
+    """
+    lo, hi = 0, len(dates)
+    # First entry on or before end_date
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if dates[mid] > end_date:
+            lo = mid + 1
+        else:
+            hi = mid
+    first = lo
+
+    # First entry before start_date
+    hi = len(dates)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if dates[mid] >= start_date:
+            lo = mid + 1
+        else:
+            hi = mid
+    return first, lo
+
+
+def _extract_mdna(content: str) -> Optional[str]:
+    """
+    Locate the MD&A section in filing text
+
+    Finds the section header first, then searches for the next section
+    heading within a bounded window after it instead of running a lazy
+    DOTALL group across the whole document.
+
+    Returns:
+        Section text, or None if no complete MD&A section is found
+    """
+    header = _MDA_HEADER_RE.search(content)
+    if not header:
+        return None
+
+    start = header.end()
+    end = _MDA_END_RE.search(content, start, start + MDA_WINDOW_CHARS)
+    if not end:
+        return None
+
+    return content[start:end.start()].strip()
+
+
 class SECEdgarClient:
     """
     SEC EDGAR API Client for automated filing retrieval
@@ -26,46 +171,87 @@ class SECEdgarClient:
     BASE_URL = "https://www.sec.gov"
     EDGAR_API_BASE = "https://data.sec.gov"
 
-    # Rate limiting: SEC allows 10 requests per second, 100 per minute
-    REQUEST_DELAY = 0.15  # 150ms delay between requests
+    # Rate limiting: SEC allows 10 requests per second. A token bucket refilled at
+    # REQUEST_RATE holding at most REQUEST_BURST tokens never exceeds
+    # REQUEST_BURST + REQUEST_RATE requests in any one-second window.
+    REQUEST_RATE = 8.0
+    REQUEST_BURST = 2
+
+    # Company CIK mappings for energy infrastructure companies (shared, read-only)
+    company_ciks = MappingProxyType(_COMPANY_CIKS)
+    _TICKERS = frozenset(_COMPANY_CIKS)
+    _PADDED_CIKS = MappingProxyType({t: cik.zfill(10) for t, cik in _COMPANY_CIKS.items()})
+
+    # Worker threads used for multi-company updates (all share the rate limiter)
+    MAX_WORKERS = 4
 
-    def __init__(self, user_agent: str = "EnergyICCopilot/1.0"):
+    # Submissions cache lifetimes (seconds): in-process and on-disk
+    SUBMISSIONS_TTL = 3600
+    SUBMISSIONS_DISK_TTL = 86400
+
+    def __init__(self, user_agent: str = "EnergyICCopilot/1.0", cache_dir: Optional[Path] = None):
         """
         Initialize SEC EDGAR client
 
         Args:
             user_agent: User agent string for SEC API requests (required by SEC)
+            cache_dir: Directory for on-disk response caches (default: ~/.cache/edgar)
         """
         self.user_agent = user_agent
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': self.user_agent,
-            'Accept-Encoding': 'gzip, deflate'
+            'Accept-Encoding': _ACCEPT_ENCODING
         })
-
-        # Company CIK mappings for energy infrastructure companies
-        self.company_ciks = {
-            'PPL': '0000922224',   # Pembina Pipeline Corporation
-            'ENB': '0000895728',   # Enbridge Inc.
-            'TRP': '0000867962',   # TC Energy Corporation
-            'KEY': '0000315293',   # Keyera Corp.
-            'MMP': '0001126975',   # Magellan Midstream Partners, L.P.
-            'KMI': '0001506307',   # Kinder Morgan, Inc.
-            'OKE': '0001039684',   # ONEOK, Inc.
-            'WMB': '0000107263',   # The Williams Companies, Inc.
-            'ET': '0001276187',    # Energy Transfer LP
-            'TRGP': '0001389170'   # Targa Resources Corp.
+        # Keep-alive pool sized for concurrent updates; back off on SEC throttling/5xx
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        ))
+
+        # Submissions URLs, built once per ticker
+        self._submission_urls = {
+            t: f"{self.EDGAR_API_BASE}/submissions/CIK{cik10}.json"
+            for t, cik10 in self._PADDED_CIKS.items()
         }
 
-        self._last_request_time = None
+        self._tokens = float(self.REQUEST_BURST)
+        self._last_refill = 0.0
+        self._rate_lock = threading.Lock()
+        self._submissions_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+    def _reserve_request(self) -> float:
+        """
+        Take a token from the shared bucket and return how long to wait before sending
+
+        Short bursts proceed immediately; sustained traffic is paced at REQUEST_RATE.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(self.REQUEST_BURST, self._tokens + (now - self._last_refill) * self.REQUEST_RATE)
+            self._last_refill = now
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.REQUEST_RATE
+                self._tokens = 0.0
+                self._last_refill = now + wait
+                return wait
+            self._tokens -= 1
+            return 0.0
 
     def _rate_limit(self):
-        """Implement rate limiting for SEC API requests"""
-        if self._last_request_time:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self.REQUEST_DELAY:
-                time.sleep(self.REQUEST_DELAY - elapsed)
-        self._last_request_time = time.time()
+        """Implement rate limiting for SEC API requests (token bucket shared across threads)"""
+        wait = self._reserve_request()
+        if wait:
+            time.sleep(wait)
+
+    async def _arate_limit(self):
+        """Async variant of _rate_limit; waits without blocking the event loop"""
+        wait = self._reserve_request()
+        if wait:
+            await asyncio.sleep(wait)
 
     def _make_request(self, url: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -84,13 +270,73 @@ class SECEdgarClient:
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
 
-            # SEC API returns JSON
+            # SEC API returns JSON; parse the raw bytes directly when orjson is available
+            if orjson is not None:
+                return orjson.loads(response.content)
             return response.json()
 
         except requests.exceptions.RequestException as e:
             logger.error(f"SEC API request failed: {e}")
             raise
 
+    def _get_submissions(self, ticker: str) -> Dict[str, Any]:
+        """
+        Get the EDGAR submissions document for a tracked company, using in-memory and on-disk caches
+
+        Args:
+            ticker: Company ticker symbol (must be tracked)
+
+        Returns:
+            Parsed submissions JSON
+        """
+        data = self._cached_submissions(ticker)
+        if data is None:
+            data = self._store_submissions(ticker, self._make_request(self._submission_urls[ticker]))
+        return data
+
+    async def _aget_submissions(self, ticker: str, http: "httpx.AsyncClient") -> Dict[str, Any]:
+        """Async variant of _get_submissions using a shared httpx.AsyncClient"""
+        data = self._cached_submissions(ticker)
+        if data is None:
+            await self._arate_limit()
+            response = await http.get(self._submission_urls[ticker], headers={'User-Agent': self.user_agent})
+            response.raise_for_status()
+            raw = response.content
+            data = self._store_submissions(ticker, orjson.loads(raw) if orjson is not None else json.loads(raw))
+        return data
+
+    def _cached_submissions(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Return submissions from memory or a fresh on-disk copy, or None if a request is needed"""
+        cik10 = self._PADDED_CIKS[ticker]
+
+        cached = self._submissions_cache.get(cik10)
+        if cached and time.monotonic() - cached[0] < self.SUBMISSIONS_TTL:
+            return cached[1]
+
+        cache_file = self.cache_dir / f"submissions_{cik10}.json"
+        try:
+            if time.time() - cache_file.stat().st_mtime < self.SUBMISSIONS_DISK_TTL:
+                raw = cache_file.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                self._submissions_cache[cik10] = (time.monotonic(), data)
+                return data
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _store_submissions(self, ticker: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Remember freshly downloaded submissions in memory and on disk"""
+        cik10 = self._PADDED_CIKS[ticker]
+        cache_file = self.cache_dir / f"submissions_{cik10}.json"
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(orjson.dumps(data) if orjson is not None else json.dumps(data).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Could not write submissions cache {cache_file}: {e}")
+
+        self._submissions_cache[cik10] = (time.monotonic(), data)
+        return data
+
     def get_company_filings(self, ticker: str, form_types: List[str] = None,
                           start_date: Optional[str] = None,
                           end_date: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -106,9 +352,21 @@ class SECEdgarClient:
         Returns:
             List of filing metadata
         """
-        if ticker not in self.company_ciks:
+        if ticker not in self._TICKERS:
             raise ValueError(f"Unknown ticker: {ticker}. Available: {list(self.company_ciks.keys())}")
 
+        try:
+            # SEC EDGAR submissions API (cached)
+            data = self._get_submissions(ticker)
+            return self._select_filings(ticker, data, form_types, start_date, end_date)
+
+        except Exception as e:
+            logger.error(f"Failed to get filings for {ticker}: {e}")
+            return []
+
+    def _select_filings(self, ticker: str, data: Dict[str, Any], form_types: Optional[List[str]],
+                        start_date: Optional[str], end_date: Optional[str]) -> List[Dict[str, Any]]:
+        """Filter a submissions document down to filings of the given forms and dates, newest first"""
         if form_types is None:
             form_types = ['10-K', '10-Q']
 
@@ -120,39 +378,33 @@ class SECEdgarClient:
 
         cik = self.company_ciks[ticker]
 
-        # SEC EDGAR submissions API
-        url = f"{self.EDGAR_API_BASE}/submissions/CIK{cik.zfill(10)}.json"
-
-        try:
-            data = self._make_request(url)
-
-            filings = []
-            recent_filings = data.get('filings', {}).get('recent', {})
-
-            if recent_filings:
-                forms = recent_filings.get('form', [])
-                dates = recent_filings.get('filingDate', [])
-                primary_docs = recent_filings.get('primaryDocument', [])
-                accession_numbers = recent_filings.get('accessionNumber', [])
-
-                for i, form in enumerate(forms):
-                    if form in form_types:
-                        filing_date = dates[i] if i < len(dates) else None
-                        if filing_date and start_date <= filing_date <= end_date:
-                            filings.append({
-                                'form_type': form,
-                                'filing_date': filing_date,
-                                'accession_number': accession_numbers[i] if i < len(accession_numbers) else None,
-                                'primary_document': primary_docs[i] if i < len(primary_docs) else None,
-                                'company': ticker,
-                                'cik': cik
-                            })
-
-            return sorted(filings, key=lambda x: x['filing_date'], reverse=True)
-
-        except Exception as e:
-            logger.error(f"Failed to get filings for {ticker}: {e}")
-            return []
+        filings = []
+        recent_filings = data.get('filings', {}).get('recent', {})
+
+        if recent_filings:
+            forms = recent_filings.get('form', [])
+            dates = recent_filings.get('filingDate', [])
+            primary_docs = recent_filings.get('primaryDocument', [])
+            accession_numbers = recent_filings.get('accessionNumber', [])
+
+            # Only scan entries inside the requested date window
+            lo, hi = _date_window(dates, start_date, end_date)
+            form_set = frozenset(form_types)
+
+            for form, filing_date, accession_number, primary_doc in zip_longest(
+                forms[lo:hi], dates[lo:hi], accession_numbers[lo:hi], primary_docs[lo:hi]
+            ):
+                if form in form_set and filing_date:
+                    filings.append({
+                        'form_type': form,
+                        'filing_date': filing_date,
+                        'accession_number': accession_number,
+                        'primary_document': primary_doc,
+                        'company': ticker,
+                        'cik': cik
+                    })
+
+        return sorted(filings, key=lambda x: x['filing_date'], reverse=True)
 
     def get_filing_content(self, accession_number: str, document_name: str) -> Optional[str]:
         """
@@ -168,6 +420,56 @@ class SECEdgarClient:
         if not accession_number or not document_name:
             return None
 
+        url, cache_file = self._filing_location(accession_number, document_name)
+        content = self._read_content_cache(cache_file)
+        if content is not None:
+            return content
+
+        try:
+            self._rate_limit()
+            # Stream the (transparently gzip-decoded) body instead of building response.text
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                raw = b''.join(response.iter_content(chunk_size=_STREAM_CHUNK_SIZE))
+                encoding = response.encoding
+
+            # Convert to text (usually HTML, but we'll extract text content)
+            content = _html_to_text(raw, encoding)
+
+        except Exception as e:
+            logger.error(f"Failed to download filing content: {e}")
+            return None
+
+        self._write_content_cache(cache_file, content)
+        return content
+
+    async def aget_filing_content(self, accession_number: str, document_name: str,
+                                  http: "httpx.AsyncClient") -> Optional[str]:
+        """Async variant of get_filing_content using a shared httpx.AsyncClient"""
+        if not accession_number or not document_name:
+            return None
+
+        url, cache_file = self._filing_location(accession_number, document_name)
+        content = self._read_content_cache(cache_file)
+        if content is not None:
+            return content
+
+        try:
+            await self._arate_limit()
+            response = await http.get(url, headers={'User-Agent': self.user_agent})
+            response.raise_for_status()
+            # HTML parsing is CPU-bound; keep it off the event loop
+            content = await asyncio.to_thread(_html_to_text, response.content, response.encoding)
+
+        except Exception as e:
+            logger.error(f"Failed to download filing content: {e}")
+            return None
+
+        await asyncio.to_thread(self._write_content_cache, cache_file, content)
+        return content
+
+    def _filing_location(self, accession_number: str, document_name: str) -> Tuple[str, Path]:
+        """EDGAR archive URL and on-disk text cache path for a filing document"""
         # Extract numeric CIK and cleaned accession number per EDGAR URL structure
         try:
             cik_padded = accession_number.split('-')[0]
@@ -179,29 +481,32 @@ class SECEdgarClient:
 
         # Construct filing URL: /Archives/edgar/data/{CIK}/{ACCESSION_NO_NO_DASHES}/{PRIMARY_DOC}
         url = f"{self.BASE_URL}/Archives/edgar/data/{cik_numeric}/{clean_accession}/{document_name}"
+        # Filings are immutable per accession, so cleaned text can be reused indefinitely
+        cache_file = self.cache_dir / "content" / f"{clean_accession}_{Path(document_name).name}.txt.gz"
+        return url, cache_file
 
+    def _read_content_cache(self, cache_file: Path) -> Optional[str]:
+        """Cached filing text, or None if it has not been downloaded yet"""
         try:
-            self._rate_limit()
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-
-            # Convert to text (usually HTML, but we'll extract text content)
-            content = response.text
-
-            # Basic HTML cleaning for text extraction
-            # Remove scripts and styles
-            content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL | re.IGNORECASE)
-            content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL | re.IGNORECASE)
-
-            # Extract text from HTML
-            content = re.sub(r'<[^>]+>', ' ', content)
-            content = re.sub(r'\s+', ' ', content).strip()
-
-            return content
+            with gzip.open(cache_file, 'rt', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
+        except (OSError, EOFError) as e:
+            logger.warning(f"Ignoring unreadable filing cache {cache_file}: {e}")
+        return None
 
-        except Exception as e:
-            logger.error(f"Failed to download filing content: {e}")
-            return None
+    def _write_content_cache(self, cache_file: Path, content: str):
+        """Store filing text in the on-disk cache"""
+        try:
+            # Write to a temp file first so concurrent readers never see a partial cache entry
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+            with gzip.open(tmp_file, 'wt', encoding='utf-8') as f:
+                _write_chunked(f, content)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write filing cache {cache_file}: {e}")
 
     def get_latest_10q(self, ticker: str) -> Optional[Dict[str, Any]]:
         """
@@ -229,6 +534,35 @@ class SECEdgarClient:
         filings = self.get_company_filings(ticker, ['10-K'])
         return filings[0] if filings else None
 
+    def get_latest_periodic(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the most recent periodic report (10-Q or 10-K) for a company
+
+        Both forms are picked from a single scan of the submissions index, so this
+        replaces chaining get_latest_10q and get_latest_10k.
+
+        Args:
+            ticker: Company ticker symbol
+
+        Returns:
+            Newest 10-Q/10-K filing metadata or None
+        """
+        filings = self.get_company_filings(ticker, ['10-Q', '10-K'])
+        return filings[0] if filings else None
+
+    async def aget_latest_periodic(self, ticker: str, http: "httpx.AsyncClient") -> Optional[Dict[str, Any]]:
+        """Async variant of get_latest_periodic using a shared httpx.AsyncClient"""
+        if ticker not in self._TICKERS:
+            raise ValueError(f"Unknown ticker: {ticker}. Available: {list(self.company_ciks.keys())}")
+
+        try:
+            data = await self._aget_submissions(ticker, http)
+            filings = self._select_filings(ticker, data, ['10-Q', '10-K'], None, None)
+        except Exception as e:
+            logger.error(f"Failed to get filings for {ticker}: {e}")
+            return None
+        return filings[0] if filings else None
+
     def get_latest_mdna(self, ticker: str) -> Optional[str]:
         """
         Get the latest Management's Discussion and Analysis section
@@ -239,8 +573,8 @@ class SECEdgarClient:
         Returns:
             MD&A content as text or None
         """
-        # Try 10-Q first (more recent), then 10-K
-        filing = self.get_latest_10q(ticker) or self.get_latest_10k(ticker)
+        # Newest of the latest 10-Q and 10-K
+        filing = self.get_latest_periodic(ticker)
 
         if not filing:
             return None
@@ -252,11 +586,10 @@ class SECEdgarClient:
 
         if content:
             # Extract MD&A section (basic pattern matching)
-            mda_pattern = r'(?i)(?:MANAGEMENT.?S DISCUSSION AND ANALYSIS|MD&A)(.*?)(?:QUANTITATIVE AND QUALITATIVE|FINANCIAL STATEMENTS|CHANGES IN)'
-            match = re.search(mda_pattern, content, re.DOTALL)
+            section = _extract_mdna(content)
 
-            if match:
-                return match.group(1).strip()
+            if section is not None:
+                return section
             else:
                 # Return full content if MD&A section not clearly identified
                 return content
@@ -299,13 +632,16 @@ class SECEdgarClient:
             filename = f"{ticker.lower()}_{latest_filing['filing_date'].replace('-', '_')}_mda.txt"
             filepath = output_dir / filename
 
+            # Stream header and body separately rather than concatenating a second full copy
+            header = (
+                f"{ticker.upper()} CORPORATION\n"
+                "Management's Discussion and Analysis\n"
+                f"For the period ended {latest_filing['filing_date']}\n"
+                "Downloaded from SEC EDGAR\n\n"
+            )
             with open(filepath, 'w', encoding='utf-8') as f:
-                # Add header information
-                f.write(f"{ticker.upper()} CORPORATION\n")
-                f.write("Management's Discussion and Analysis\n")
-                f.write(f"For the period ended {latest_filing['filing_date']}\n")
-                f.write("Downloaded from SEC EDGAR\n\n")
-                f.write(content)
+                f.write(header)
+                _write_chunked(f, content)
 
             logger.info(f"Updated {ticker} filing: {filepath}")
             return True
@@ -324,18 +660,16 @@ class SECEdgarClient:
         Returns:
             Dictionary mapping ticker to success status
         """
-        results = {}
-
-        for ticker in self.company_ciks.keys():
+        def update(ticker: str) -> Tuple[str, bool]:
             try:
-                success = self.update_company_filings(ticker, output_dir)
-                results[ticker] = success
-                time.sleep(1)  # Additional delay between companies
+                return ticker, self.update_company_filings(ticker, output_dir)
             except Exception as e:
                 logger.error(f"Error updating {ticker}: {e}")
-                results[ticker] = False
+                return ticker, False
 
-        return results
+        # Network-bound: overlap companies, the shared rate limiter keeps us within SEC limits
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            return dict(executor.map(update, self.company_ciks))
 
     def get_filing_metadata(self, ticker: str) -> Dict[str, Any]:
         """
@@ -347,8 +681,10 @@ class SECEdgarClient:
         Returns:
             Dictionary with filing metadata
         """
-        filings_10q = self.get_company_filings(ticker, ['10-Q'], start_date='2023-01-01')
-        filings_10k = self.get_company_filings(ticker, ['10-K'], start_date='2023-01-01')
+        # One lookup for both form types, split locally (result stays newest first)
+        all_filings = self.get_company_filings(ticker, ['10-Q', '10-K'], start_date='2023-01-01')
+        filings_10q = [f for f in all_filings if f['form_type'] == '10-Q']
+        filings_10k = [f for f in all_filings if f['form_type'] == '10-K']
 
         return {
             'company': ticker,
@@ -361,17 +697,19 @@ class SECEdgarClient:
 
 
 # Convenience functions
-def get_sec_client(user_agent: str = "EnergyICCopilot/1.0 (contact@example.com)") -> SECEdgarClient:
+def get_sec_client(user_agent: str = "EnergyICCopilot/1.0 (contact@example.com)",
+                   cache_dir: Optional[Path] = None) -> SECEdgarClient:
     """
     Get configured SEC EDGAR client
 
     Args:
         user_agent: User agent string (include contact email as required by SEC)
+        cache_dir: Directory for on-disk response caches (default: ~/.cache/edgar)
 
     Returns:
         Configured SEC EDGAR client
     """
-    return SECEdgarClient(user_agent)
+    return SECEdgarClient(user_agent, cache_dir)
 
 
 def update_all_filings(output_dir: Path, user_agent: str = None) -> Dict[str, bool]:
@@ -26,14 +26,246 @@ Supported KPIs:
 Author: Energy IC Copilot Team
 """
 
+import mmap
+import multiprocessing
+import os
 import re
+import sys
+import threading
 import yaml
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from pydantic import BaseModel
 
 from .cite import Citation, CitationManager, create_citation_from_match
 
+# Prefer the libyaml-backed loader when available (same output, much faster parse)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Mapping patterns compile with the third-party ``regex`` engine when installed: it
+# is a drop-in for ``re`` and supports a per-search timeout, so one pathological
+# pattern cannot hang an extraction. Without it the stdlib engine runs untimed.
+try:
+    import regex as _pattern_engine
+
+    _SEARCH_OPTIONS: Dict[str, Any] = {'timeout': 5.0}  # seconds per search
+except ImportError:  # pragma: no cover - optional dependency
+    _pattern_engine = re
+    _SEARCH_OPTIONS = {}
+
+# Flags applied to every mapping pattern
+_PATTERN_FLAGS = _pattern_engine.IGNORECASE | _pattern_engine.MULTILINE
+
+# Numeric cleanup and scale detection, compiled once for all extractions
+_CURRENCY_STRIP = str.maketrans('', '', '$,')
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')  # commas are stripped first, so 1234.56
+# Scale keywords, compared against whole words of the lower-cased match text
+_WORD_SPLIT_RE = re.compile(r'\W+')
+_BILLION_WORDS = frozenset({'billion', 'billions', 'bn'})
+_THOUSAND_WORDS = frozenset({'thousand', 'thousands'})
+
+# Backreferences would point at the wrong group once patterns are fused
+_BACKREF_RE = re.compile(r'\\[1-9]|\(\?P=')
+
+# Leading bytes checked before trying the ASCII-only decode of a document
+_ASCII_PEEK_BYTES = 64 * 1024
+
+# Anchor literals shorter than this are too common to rule anything out
+_ANCHOR_MIN_LEN = 3
+# Inline flags (e.g. verbose mode) change what a literal character means
+_INLINE_FLAGS_RE = re.compile(r'\(\?[aiLmsux]')
+_BRACE_QUANTIFIER_RE = re.compile(r'\d*(?:,\d*)?\}')
+# Non-ASCII characters that IGNORECASE matches against ASCII letters although
+# str.lower() does not map them onto those letters
+_CASE_FOLD_EXCEPTIONS = ('\u0130', '\u0131', '\u017f', '\u212a')
+
+
+# Process pool shared by every extract_many call, started on first use
+_EXTRACT_POOL: Optional[ProcessPoolExecutor] = None
+_EXTRACT_POOL_LOCK = threading.Lock()
+
+
+def _extract_pool() -> ProcessPoolExecutor:
+    """
+    Return the process-wide extraction pool, creating it on first use.
+
+    Workers are started from a forkserver (spawn where unavailable) rather than
+    forked, since callers such as the API run this from a multi-threaded process.
+    """
+    global _EXTRACT_POOL
+    with _EXTRACT_POOL_LOCK:
+        if _EXTRACT_POOL is None:
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _EXTRACT_POOL = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1, mp_context=multiprocessing.get_context(method)
+            )
+        return _EXTRACT_POOL
+
+
+def _discard_extract_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next extract_many call starts a fresh one."""
+    global _EXTRACT_POOL
+    with _EXTRACT_POOL_LOCK:
+        if _EXTRACT_POOL is pool:
+            _EXTRACT_POOL = None
+    pool.shutdown(wait=False)
+
+
+@lru_cache(maxsize=512)
+def _scale_multiplier(text: str) -> float:
+    """Scale to millions for lower-cased match text: billions win over thousands."""
+    words = set(_WORD_SPLIT_RE.split(text))
+    if not _BILLION_WORDS.isdisjoint(words):
+        return 1000.0
+    if not _THOUSAND_WORDS.isdisjoint(words):
+        return 0.001
+    return 1.0
+
+
+# Decoded documents kept by _read_text_cached, bounded by their total length
+# (about one byte per character for the ASCII text filings nearly always are)
+_TEXT_CACHE: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+_TEXT_CACHE_MAX_CHARS = 16 * 1024 * 1024
+_TEXT_CACHE_CHARS = 0
+_TEXT_CACHE_LOCK = threading.Lock()
+
+
+def _read_text_cached(path: str, mtime_ns: int, size: int) -> str:
+    """
+    _read_text memoized on the path and stat signature.
+
+    A file that is rewritten gets a new (mtime_ns, size) signature and replaces its
+    entry, so stale text is never served; extractors created per call still share the
+    cache. Least recently used documents are evicted once the cache holds more than
+    _TEXT_CACHE_MAX_CHARS characters, and larger documents are not cached at all.
+    """
+    global _TEXT_CACHE_CHARS
+    with _TEXT_CACHE_LOCK:
+        entry = _TEXT_CACHE.get(path)
+        if entry is not None and entry[:2] == (mtime_ns, size):
+            _TEXT_CACHE.move_to_end(path)
+            return entry[2]
+
+    text = _read_text(path) if size else ''
+    if len(text) > _TEXT_CACHE_MAX_CHARS:
+        return text
+    with _TEXT_CACHE_LOCK:
+        old = _TEXT_CACHE.pop(path, None)
+        if old is not None:
+            _TEXT_CACHE_CHARS -= len(old[2])
+        _TEXT_CACHE[path] = (mtime_ns, size, text)
+        _TEXT_CACHE_CHARS += len(text)
+        while _TEXT_CACHE_CHARS > _TEXT_CACHE_MAX_CHARS:
+            _TEXT_CACHE_CHARS -= len(_TEXT_CACHE.popitem(last=False)[1][2])
+    return text
+
+
+def _clear_text_cache() -> None:
+    """Drop every document held by _read_text_cached."""
+    global _TEXT_CACHE_CHARS
+    with _TEXT_CACHE_LOCK:
+        _TEXT_CACHE.clear()
+        _TEXT_CACHE_CHARS = 0
+
+
+def _read_text(path: str) -> str:
+    """
+    Read a document as UTF-8 text.
+
+    The text is decoded straight from a memory map of the file, so no intermediate
+    bytes copy of a multi-MB filing is held alongside it. Filings are nearly always
+    pure ASCII, so when the first block is, the cheaper ASCII decoder is tried first.
+    """
+    if not os.path.getsize(path):
+        return ''  # mmap cannot map an empty file
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        text = None
+        if mapped[:_ASCII_PEEK_BYTES].isascii():
+            try:
+                text = str(mapped, 'ascii')
+            except UnicodeDecodeError:
+                pass  # non-ASCII further in: decode the whole file as UTF-8
+        if text is None:
+            text = str(mapped, 'utf-8')
+    # Same universal-newline translation as reading in text mode
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    Longest literal run that every match of ``pattern`` must contain, lower-cased.
+
+    Only characters outside groups, classes and optional quantifiers count, so the
+    result is conservative; '' means no anchor could be derived.
+    """
+    if _INLINE_FLAGS_RE.search(pattern):
+        return ''
+    runs: List[str] = []
+    run: List[str] = []
+    depth = 0
+    i, n = 0, len(pattern)
+    while i < n:
+        ch = pattern[i]
+        i += 1
+        literal = None
+        if ch == '\\' and i < n:
+            escaped = pattern[i]
+            i += 1
+            if escaped in 'xuUN' or escaped.isdigit():
+                return ''  # \x20, \u..., \N{...}, \101, \1: the text is not the payload
+            if not escaped.isalnum():  # \d, \s, \b ... are not literals
+                literal = escaped
+        elif ch == '[':
+            if i < n and pattern[i] == '^':
+                i += 1
+            if i < n and pattern[i] == ']':
+                i += 1
+            while i < n and pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+            i += 1
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == '|':
+            if depth == 0:
+                return ''  # top-level alternation: nothing is required
+        elif ch in '?*{':
+            if ch == '{':
+                quantifier = _BRACE_QUANTIFIER_RE.match(pattern, i)
+                if quantifier is None:
+                    return ''  # literal brace or an engine extension such as {e<=1}
+                i = quantifier.end()
+            if ch and run:
+                run.pop()  # the quantified character may be absent
+        elif ch not in '.^$+' and ch.isascii():
+            literal = ch
+
+        if literal is not None and depth == 0:
+            run.append(literal)
+        elif run:
+            runs.append(''.join(run))
+            run = []
+    if run:
+        runs.append(''.join(run))
+
+    anchor = max(runs, key=len, default='')
+    return anchor.lower() if len(anchor) >= _ANCHOR_MIN_LEN else ''
+
+
+def _anchor_text(content: str) -> Optional[str]:
+    """Lower-cased content for anchor lookups, or None if it could miss an IGNORECASE match."""
+    if not content.isascii() and any(ch in content for ch in _CASE_FOLD_EXCEPTIONS):
+        return None
+    return content.lower()
+
 
 class ExtractedKPI(BaseModel):
     """
@@ -60,6 +292,46 @@ class ExtractedKPI(BaseModel):
     citation: Citation  # Full citation with document reference
 
 
+@dataclass(slots=True, frozen=True)
+class KPIConfig:
+    """Extraction rules for one KPI, validated and compiled when mappings load."""
+
+    patterns: Tuple[Tuple[str, re.Pattern], ...]  # (source, compiled) in priority order
+    unit: str
+    prefer: str  # '' when no preference is configured
+    normalize: str
+    fused: Optional[re.Pattern]  # alternation of all patterns, None if not fusable
+    anchors: Tuple[str, ...]  # lower-cased; no match is possible unless one occurs
+
+    @classmethod
+    def from_mapping(cls, config: Dict[str, Any]) -> "KPIConfig":
+        """Build from a raw YAML entry, skipping patterns that fail to compile."""
+        patterns = config.get('patterns') or []
+        if not isinstance(patterns, list):
+            raise TypeError(f"KPI patterns must be a list, got {type(patterns).__name__}")
+        compiled = []
+        for pattern in patterns:
+            try:
+                compiled.append((pattern, _pattern_engine.compile(pattern, _PATTERN_FLAGS)))
+            except (_pattern_engine.error, TypeError) as e:
+                print(f"Skipping invalid KPI pattern '{pattern}': {e}")
+        anchors = config.get('anchors')
+        if anchors is None:
+            derived = [_required_literal(pattern) for pattern, _ in compiled]
+            anchors = derived if derived and all(derived) else []
+        elif not isinstance(anchors, list) or not all(isinstance(a, str) for a in anchors):
+            raise TypeError("KPI anchors must be a list of strings")
+        unit = config.get('unit', '')
+        return cls(
+            patterns=tuple(compiled),
+            unit=sys.intern(unit) if isinstance(unit, str) else unit,
+            prefer=config.get('prefer') or '',
+            normalize=config.get('normalize') or '',
+            fused=KPIExtractor._fuse_patterns([pattern for pattern, _ in compiled]),
+            anchors=tuple(dict.fromkeys(anchor.lower() for anchor in anchors)),
+        )
+
+
 class KPIExtractor:
     """
     Intelligent KPI extraction engine for financial documents.
@@ -94,6 +366,9 @@ class KPIExtractor:
             normalize: "strip_commas"
     """
 
+    # Below this many documents extract_many stays serial (pool startup costs more)
+    PARALLEL_MIN_FILES = 4
+
     def __init__(self, mappings_path: Path):
         """
         Initialize the KPI extractor with configuration mappings.
@@ -109,24 +384,62 @@ class KPIExtractor:
         self.mappings = self._load_mappings(mappings_path)
         self.citation_manager = CitationManager()
 
-    def _load_mappings(self, path: Path) -> Dict[str, Any]:
+    def _load_mappings(self, path: Path) -> Dict[str, Dict[str, KPIConfig]]:
         """
         Load and validate KPI extraction mappings from YAML configuration.
 
+        Each KPI entry is frozen into a ``KPIConfig`` whose regexes are compiled once
+        per extractor rather than on every extraction. Patterns that fail to compile
+        are reported and skipped; a malformed entry raises at load time instead of
+        part-way through an extraction. A KPI may list ``anchors``, literals of which
+        at least one occurs in any match; otherwise they are derived from the
+        patterns when every pattern has one.
+
         Args:
             path: Path to the mappings YAML file
 
         Returns:
-            Dict containing ticker-specific KPI extraction configurations
+            Dict mapping ticker -> KPI name -> KPIConfig
 
         Raises:
             FileNotFoundError: If the mappings file doesn't exist
             yaml.YAMLError: If the YAML file is malformed
+            TypeError: If a ticker or KPI entry is not a mapping
         """
         with open(path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            mappings = yaml.load(f, Loader=_YAML_LOADER)
+
+        loaded: Dict[str, Dict[str, KPIConfig]] = {}
+        for ticker, ticker_mappings in (mappings or {}).items():
+            if not isinstance(ticker_mappings, dict):
+                raise TypeError(f"Mappings for {ticker} must be a mapping of KPIs")
+            configs = {}
+            for kpi_name, config in ticker_mappings.items():
+                if not isinstance(config, dict):
+                    raise TypeError(f"Mapping for {ticker}.{kpi_name} must be a mapping")
+                configs[kpi_name] = KPIConfig.from_mapping(config)
+            loaded[ticker] = configs
+
+        return loaded
+
+    @staticmethod
+    def _fuse_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+        """
+        Combine a KPI's patterns into one alternation.
+
+        A single search with it tells whether any pattern matches and where the
+        earliest match can start, replacing one full-document pass per pattern.
+        """
+        if not patterns or any(_BACKREF_RE.search(pattern) for pattern in patterns):
+            return None
+        try:
+            return _pattern_engine.compile(
+                '|'.join(f'(?:{pattern})' for pattern in patterns), _PATTERN_FLAGS
+            )
+        except _pattern_engine.error:
+            return None
 
-    def extract_from_file(self, file_path: Path, ticker: str) -> Dict[str, ExtractedKPI]:
+    def extract_from_file(self, file_path: Path, ticker: str, cache: bool = True) -> Dict[str, ExtractedKPI]:
         """
         Extract all configured KPIs from a single financial document.
 
@@ -147,6 +460,8 @@ class KPIExtractor:
                      (supports .txt, .pdf, .html, .htm extensions)
             ticker: Company ticker symbol (e.g., "PPL", "ENB", "TRP")
                    Must have corresponding configuration in mappings file
+            cache: Keep the document text in the shared read cache. Pass False for
+                   one-shot files (e.g. temporary uploads) that will not be read again
 
         Returns:
             Dict[str, ExtractedKPI]: Dictionary mapping KPI names to extracted values
@@ -163,8 +478,27 @@ class KPIExtractor:
             # Returns: {"EBITDA": ExtractedKPI(...), "NetDebt": ExtractedKPI(...)}
         """
         # Read file content
-        content = self._read_file_content(file_path)
+        content = self._read_file_content(file_path, cache)
+        return self.extract_from_text(content, ticker, file_path.name)
+
+    def extract_from_text(self, content: str, ticker: str, doc_id: str) -> Dict[str, ExtractedKPI]:
+        """
+        Extract all configured KPIs from document text already held in memory.
+
+        Same matching rules as extract_from_file, without a disk round-trip for
+        content that was downloaded or cached as a string.
+
+        Args:
+            content: Full document text
+            ticker: Company ticker symbol with a configuration in the mappings file
+            doc_id: Document identifier recorded in each citation
 
+        Returns:
+            Dict[str, ExtractedKPI]: Dictionary mapping KPI names to extracted values
+
+        Raises:
+            ValueError: If ticker has no mappings in configuration
+        """
         # Extract KPIs using ticker-specific patterns
         extracted_kpis = {}
 
@@ -172,97 +506,148 @@ class KPIExtractor:
             raise ValueError(f"No mappings found for ticker: {ticker}")
 
         ticker_mappings = self.mappings[ticker]
+        anchor_text = _anchor_text(content)
+        anchor_hits: Dict[str, bool] = {}
 
         for kpi_name, config in ticker_mappings.items():
-            patterns = config.get('patterns', [])
-            unit = config.get('unit', '')
-            prefer = config.get('prefer', '')
-            normalize = config.get('normalize', '')
-
-            # Try each pattern
-            best_match = None
-            best_value = None
-            best_citation = None
-
-            for pattern in patterns:
-                value, citation = self._extract_single_kpi(
-                    content, pattern, file_path.name, unit, normalize
+            patterns = config.patterns
+            unit = config.unit
+            prefer = config.prefer
+            normalize = config.normalize
+
+            # Cheap literal prefilter: without any of its anchors a KPI cannot match
+            if config.anchors and anchor_text is not None:
+                for anchor in config.anchors:
+                    hit = anchor_hits.get(anchor)
+                    if hit is None:
+                        hit = anchor_hits[anchor] = anchor in anchor_text
+                    if hit:
+                        break
+                else:
+                    continue
+
+            # Skip KPIs with no match anywhere; otherwise no pattern can match before
+            # the fused match, so the ordered per-pattern searches start there
+            start = 0
+            fused = config.fused
+            if fused is not None:
+                try:
+                    first = fused.search(content, **_SEARCH_OPTIONS)
+                except TimeoutError:
+                    pass  # gate gave up; the individual patterns still search from 0
+                else:
+                    if first is None:
+                        continue
+                    start = first.start()
+
+            # A match is preferred only if it contains the prefer term, so when the term
+            # never occurs the first match is final and later patterns need not run
+            if prefer and content.find(prefer, start) == -1:
+                prefer = ''
+
+            # Try each pattern, staging (value, citation) so the KPI is built once
+            staged = None
+
+            for _, regex in patterns:
+                value, citation, match_text = self._extract_single_kpi(
+                    content, regex, doc_id, unit, normalize, start
                 )
+                if value is None:
+                    continue
 
-                if value is not None:
-                    # If we have a preference rule, prioritize matches containing the preferred term
-                    if prefer:
-                        regex = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-                        match = regex.search(content)
-                        if match and prefer in match.group(0):
-                            # This is a preferred match, use it immediately
-                            extracted_kpis[kpi_name] = ExtractedKPI(
-                                value=value,
-                                unit=unit,
-                                citation=citation
-                            )
-                            best_match = None  # Clear any previous non-preferred match
-                            break
-                        elif best_match is None:
-                            # Store as potential match but keep looking for preferred
-                            best_match = pattern
-                            best_value = value
-                            best_citation = citation
-                    else:
-                        # No preference, use first match
-                        extracted_kpis[kpi_name] = ExtractedKPI(
-                            value=value,
-                            unit=unit,
-                            citation=citation
-                        )
-                        break
+                # Without a preference the first match wins; with one, the first match
+                # containing the preferred term wins over any earlier match
+                if not prefer or prefer in match_text:
+                    staged = (value, citation)
+                    break
+                if staged is None:
+                    # Keep the first non-preferred match but keep looking for a preferred one
+                    staged = (value, citation)
 
-            # If we found a non-preferred match and no preferred match, use it
-            if best_match and kpi_name not in extracted_kpis:
+            if staged is not None:
                 extracted_kpis[kpi_name] = ExtractedKPI(
-                    value=best_value,
+                    value=staged[0],
                     unit=unit,
-                    citation=best_citation
+                    citation=staged[1]
                 )
 
         return extracted_kpis
 
-    def _read_file_content(self, file_path: Path) -> str:
+    def extract_many(self, file_paths: List[Path], ticker: str) -> List[Dict[str, ExtractedKPI]]:
+        """
+        Extract KPIs from several documents, fanning out to worker processes.
+
+        Documents are independent and extraction is CPU-bound regex work, so larger
+        batches run in a shared process pool (serially if the pool breaks); a document
+        that fails is reported and contributes an empty result.
+
+        Args:
+            file_paths: Documents to process
+            ticker: Company ticker symbol with a configuration in the mappings file
+
+        Returns:
+            List[Dict[str, ExtractedKPI]]: Extracted KPIs per document, in input order
+        """
+        if len(file_paths) < self.PARALLEL_MIN_FILES:
+            return [self._extract_file_or_report(file_path, ticker) for file_path in file_paths]
+
+        pool = _extract_pool()
+        # One chunk per worker: every worker gets a share and self is pickled once per chunk
+        chunksize = max(1, len(file_paths) // min(len(file_paths), os.cpu_count() or 1))
+        try:
+            return list(pool.map(
+                partial(self._extract_file_or_report, ticker=ticker), file_paths, chunksize=chunksize
+            ))
+        except BrokenProcessPool:
+            _discard_extract_pool(pool)
+            return [self._extract_file_or_report(file_path, ticker) for file_path in file_paths]
+
+    def _extract_file_or_report(self, file_path: Path, ticker: str) -> Dict[str, ExtractedKPI]:
+        """extract_from_file that reports failures and returns no KPIs instead of raising."""
+        try:
+            return self.extract_from_file(file_path, ticker)
+        except Exception as e:
+            print(f"Error processing {file_path}: {e}")
+            return {}
+
+    def _read_file_content(self, file_path: Path, cache: bool = True) -> str:
         """Read content from file (supports txt, pdf, html)."""
         suffix = file_path.suffix.lower()
 
-        if suffix == '.txt':
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+        if suffix in ('.txt', '.html', '.htm'):
+            if not cache:
+                return _read_text(str(file_path))
+            stat = file_path.stat()
+            return _read_text_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
         elif suffix == '.pdf':
             # For now, return placeholder - would need pdfplumber/pymupdf
             return f"SAMPLE PDF CONTENT FROM {file_path.name}"
-        elif suffix in ['.html', '.htm']:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
         else:
             raise ValueError(f"Unsupported file type: {suffix}")
 
     def _extract_single_kpi(
         self,
         content: str,
-        pattern: str,
+        regex: re.Pattern,
         doc_id: str,
         unit: str,
-        normalize: str
-    ) -> Tuple[Optional[float], Optional[Citation]]:
+        normalize: str,
+        pos: int = 0
+    ) -> Tuple[Optional[float], Optional[Citation], Optional[str]]:
         """
-        Extract a single KPI value using regex pattern.
+        Extract a single KPI value using a compiled mapping pattern.
+
+        The search begins at ``pos``, which callers set only when no match can
+        start earlier.
 
         Returns:
-            Tuple of (value, citation) or (None, None) if not found
+            Tuple of (value, citation, matched text) or (None, None, None) if not found
         """
         try:
-            regex = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-            match = regex.search(content)
+            match = regex.search(content, pos, **_SEARCH_OPTIONS)
 
             if not match:
-                return None, None
+                return None, None, None
 
             # Extract numeric value from match
             # Prefer explicit capturing group if present; fallback to scanning match text
@@ -270,16 +655,16 @@ class KPIExtractor:
             if match.groups():
                 raw_val = match.group(1)
                 # Clean currency/commas and convert
-                cleaned = re.sub(r'[\$,]', '', raw_val)
+                cleaned = raw_val.translate(_CURRENCY_STRIP)
                 try:
-                    value = float(cleaned.replace(',', ''))
+                    value = float(cleaned)
                 except ValueError:
                     value = self._extract_numeric_value(match_text)
             else:
                 value = self._extract_numeric_value(match_text)
 
             if value is None:
-                return None, None
+                return None, None, None
 
             # Apply normalization
             if normalize == 'strip_commas':
@@ -299,11 +684,11 @@ class KPIExtractor:
                 end_pos=match.end()
             )
 
-            return value, citation
+            return value, citation, match_text
 
         except Exception as e:
-            print(f"Error extracting KPI with pattern '{pattern}': {e}")
-            return None, None
+            print(f"Error extracting KPI with pattern '{regex.pattern}': {e}")
+            return None, None, None
 
     def _extract_numeric_value(self, text: str) -> Optional[float]:
         """
@@ -314,39 +699,14 @@ class KPIExtractor:
         - "EBITDA of $2,890" -> 2890.0
         - "18,750" -> 18750.0
         """
-        # Remove currency symbols and common text
-        cleaned = re.sub(r'[\$,]', '', text)
-
-        # Find all numeric patterns
-        number_patterns = [
-            r'\b\d{1,3}(?:,\d{3})*(?:\.\d+)?\b',  # 1,234.56 or 1234.56
-            r'\b\d+(?:\.\d+)?\b'  # Simple decimal
-        ]
-
-        all_matches = []
-        for pattern in number_patterns:
-            matches = re.findall(pattern, cleaned)
-            all_matches.extend(matches)
-
-        if all_matches:
-            # Convert all matches to floats and find the most relevant one
-            valid_values = []
-            for match in all_matches:
-                try:
-                    # Remove commas for conversion
-                    value_str = match.replace(',', '')
-                    value = float(value_str)
-                    # Skip very small numbers (likely dates/years)
-                    if value >= 100:  # Assume KPI values are at least 100
-                        valid_values.append(value)
-                except ValueError:
-                    continue
+        # Remove currency symbols and thousands separators
+        cleaned = text.translate(_CURRENCY_STRIP)
 
-            if valid_values:
-                # Return the largest value (most likely to be the KPI)
-                return max(valid_values)
-
-        return None
+        # Keep the largest number (most likely to be the KPI). findall/map keep the
+        # scan and conversion in C; float() accepts every digit \d can match.
+        # Skip very small numbers (likely dates/years); assume KPI values are at least 100
+        values = [value for value in map(float, _NUMBER_RE.findall(cleaned)) if value >= 100]
+        return max(values) if values else None
 
     def _infer_scale_multiplier(self, text: str) -> float:
         """
@@ -358,17 +718,7 @@ class KPIExtractor:
         - contains 'million', 'mm', '(mm)' => ×1
         - default => ×1 (assume already in millions per mappings convention)
         """
-        t = text.lower()
-        # explicit billion
-        if re.search(r"\bbillion(s)?\b|\bbn\b", t):
-            return 1000.0
-        # explicit thousand
-        if re.search(r"\bthousand(s)?\b", t):
-            return 0.001
-        # indications of millions
-        if re.search(r"\bmillion(s)?\b|\bmm\b|\(\$?mm\)|\$mm\b", t):
-            return 1.0
-        return 1.0
+        return _scale_multiplier(text.lower())
 
 
 def extract_kpis_from_filings(
@@ -390,18 +740,19 @@ def extract_kpis_from_filings(
     extractor = KPIExtractor(mappings_path)
     all_kpis = {}
 
-    # Find all files for this ticker
-    ticker_files = list(filings_dir.glob(f"{ticker.lower()}_*.txt"))  # Start with txt files
-
-    for file_path in ticker_files:
-        try:
-            file_kpis = extractor.extract_from_file(file_path, ticker)
-
-            # Merge with existing KPIs (later files can override earlier ones)
-            all_kpis.update(file_kpis)
-
-        except Exception as e:
-            print(f"Error processing {file_path}: {e}")
-            continue
+    # Find all files for this ticker (plain name checks; no glob/fnmatch per entry)
+    prefix = f"{ticker.lower()}_"
+    try:
+        with os.scandir(filings_dir) as entries:
+            ticker_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith('.txt')  # Start with txt files
+            ]
+    except FileNotFoundError:
+        ticker_files = []
+
+    for file_kpis in extractor.extract_many(ticker_files, ticker):
+        # Merge with existing KPIs (later files can override earlier ones)
+        all_kpis.update(file_kpis)
 
     return all_kpis
@@ -3,11 +3,20 @@ Financial valuation models for energy infrastructure companies.
 Implements EPV (Enterprise Present Value) and DCF (Discounted Cash Flow) calculations.
 """
 
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel
+from array import array
+from collections import namedtuple
+from itertools import repeat
+from typing import Annotated, Dict, List, Mapping, Optional, Any, Sequence, Tuple
+from pydantic import BaseModel, Field
 import math
 
 
+# Input bounds: reject NaN/inf and magnitudes no real filer reports, so a single
+# request cannot push the models into overflow or unbounded work
+Amount = Annotated[float, Field(ge=-1e9, le=1e9, allow_inf_nan=False)]  # millions / per-share
+Rate = Annotated[float, Field(ge=-1.0, le=1.0, allow_inf_nan=False)]  # decimal rate or weight
+
+
 class ValuationInputs(BaseModel):
     """
     Input parameters for enterprise valuation calculations.
@@ -40,36 +49,50 @@ class ValuationInputs(BaseModel):
     """
 
     # Core financial metrics (required)
-    ebitda: float
-    net_debt: float
-    maintenance_capex: float
+    ebitda: Amount
+    net_debt: Amount
+    maintenance_capex: Amount
 
     # Tax and reinvestment assumptions
-    tax_rate: float = 0.25
-    reinvestment_rate: float = 0.15
+    tax_rate: Rate = 0.25
+    reinvestment_rate: Rate = 0.15
 
     # Equity and dividend metrics (optional - enable enhanced analytics)
-    shares_outstanding: Optional[float] = None  # millions of shares
-    dividend_per_share: Optional[float] = None  # annual dividend per share
-    share_price: Optional[float] = None  # current market price
-    net_income: Optional[float] = None  # net income for ROE calculation
-    shareholder_equity: Optional[float] = None  # shareholder equity for ROE calculation
-    interest_expense: Optional[float] = None  # interest expense for coverage ratio
+    shares_outstanding: Optional[Amount] = None  # millions of shares
+    dividend_per_share: Optional[Amount] = None  # annual dividend per share
+    share_price: Optional[Amount] = None  # current market price
+    net_income: Optional[Amount] = None  # net income for ROE calculation
+    shareholder_equity: Optional[Amount] = None  # shareholder equity for ROE calculation
+    interest_expense: Optional[Amount] = None  # interest expense for coverage ratio
     # Cash flow override (for transparency when using audited CFO)
-    cash_from_operations: Optional[float] = None  # audited CFO (millions)
+    cash_from_operations: Optional[Amount] = None  # audited CFO (millions)
     fcf_mode: Optional[str] = 'standard'  # 'standard' | 'use_cfo'
 
     # WACC (Weighted Average Cost of Capital) components
-    risk_free_rate: float = 0.04  # typically 10-year Treasury yield
-    market_risk_premium: float = 0.06  # equity risk premium
-    beta: float = 0.8  # company-specific risk measure
-    cost_of_debt: float = 0.05  # pre-tax cost of debt
-    debt_weight: float = 0.4  # proportion of debt in capital structure
-    equity_weight: float = 0.6  # proportion of equity in capital structure
+    risk_free_rate: Rate = 0.04  # typically 10-year Treasury yield
+    market_risk_premium: Rate = 0.06  # equity risk premium
+    beta: Annotated[float, Field(ge=-10.0, le=10.0, allow_inf_nan=False)] = 0.8  # company-specific risk measure
+    cost_of_debt: Rate = 0.05  # pre-tax cost of debt
+    debt_weight: Rate = 0.4  # proportion of debt in capital structure
+    equity_weight: Rate = 0.6  # proportion of equity in capital structure
 
     # DCF (Discounted Cash Flow) specific parameters
-    terminal_growth: float = 0.02  # long-term growth rate
-    projection_years: int = 5  # explicit projection period
+    terminal_growth: Rate = 0.02  # long-term growth rate
+    projection_years: Annotated[int, Field(ge=1, le=100)] = 5  # explicit projection period
+
+    def to_fast(self) -> "ValuationInputsFast":
+        """Copy into the validation-free tuple form used on hot paths."""
+        return ValuationInputsFast(**self.__dict__)
+
+
+# Plain tuple mirror of ValuationInputs (same fields and defaults) for hot loops:
+# construction skips validation and attribute reads avoid pydantic's lookup path.
+# Engine methods accept either type; build these only from validated inputs.
+ValuationInputsFast = namedtuple(
+    'ValuationInputsFast',
+    list(ValuationInputs.model_fields),
+    defaults=[field.default for field in ValuationInputs.model_fields.values() if not field.is_required()],
+)
 
 
 class ValuationScenario(BaseModel):
@@ -85,9 +108,9 @@ class ValuationScenario(BaseModel):
         ebitda_uplift: Direct adjustment to EBITDA as percentage (spread normalization)
     """
 
-    rate_bps_change: int = 0  # +/- basis points (e.g., +200 = +2%)
-    throughput_pct_change: float = 0.0  # +/- percentage (e.g., -0.05 = -5%)
-    ebitda_uplift: float = 0.0  # percentage uplift/drag (e.g., 0.02 = +2%)
+    rate_bps_change: Annotated[int, Field(ge=-10_000, le=10_000)] = 0  # +/- basis points (e.g., +200 = +2%)
+    throughput_pct_change: Annotated[float, Field(ge=-1.0, le=10.0, allow_inf_nan=False)] = 0.0  # +/- percentage (e.g., -0.05 = -5%)
+    ebitda_uplift: Annotated[float, Field(ge=-1.0, le=10.0, allow_inf_nan=False)] = 0.0  # percentage uplift/drag (e.g., 0.02 = +2%)
 
 
 class ValuationResults(BaseModel):
@@ -154,6 +177,54 @@ class ValuationResults(BaseModel):
     calculation_trace: List[Dict[str, Any]] = []
 
 
+def _wacc_kernel(risk_free_rate: float, market_risk_premium: float, beta: float,
+                 cost_of_debt: float, tax_rate: float, debt_weight: float,
+                 equity_weight: float) -> Tuple[float, float, float]:
+    """
+    WACC from plain floats: returns (wacc, cost_of_equity, cost_of_debt_after_tax).
+
+    The engine methods unpack the pydantic inputs and call this, so sweeps over many
+    assumption sets can call it directly without building models.
+    """
+    cost_of_equity = risk_free_rate + (beta * market_risk_premium)  # CAPM
+    cost_of_debt_after_tax = cost_of_debt * (1 - tax_rate)
+    wacc = (equity_weight * cost_of_equity) + (debt_weight * cost_of_debt_after_tax)
+    return wacc, cost_of_equity, cost_of_debt_after_tax
+
+
+def _dcf_kernel(fcff: float, wacc: float, terminal_growth: float,
+                projection_years: int) -> Tuple[float, float, float]:
+    """
+    DCF pieces from plain floats for WACC > 0.
+
+    Returns (sum of explicit-period PVs, un-discounted terminal value, PV of terminal
+    value); the DCF value is the sum of the first and last.
+    """
+    # The PVs form a geometric series: Σ FCFF_0 × r^t = FCFF_0 × r × (r^N - 1) / (r - 1)
+    # with r = (1+g)/(1+WACC). r - 1 = (g - WACC) / (1 + WACC) is formed directly, and
+    # r^N - 1 via expm1/log1p, so the closed form stays accurate when g is close to WACC
+    growth_discount = (1 + terminal_growth) / (1 + wacc)
+    rate_gap = (terminal_growth - wacc) / (1 + wacc)
+    if rate_gap == 0:
+        sum_pv_fcff = fcff * projection_years
+    elif growth_discount == 0:
+        sum_pv_fcff = 0.0  # g = -100%: nothing is left after year 0
+    else:
+        sum_pv_fcff = fcff * growth_discount * math.expm1(projection_years * math.log1p(rate_gap)) / rate_gap
+
+    # Terminal value using Gordon Growth Model
+    # TV = FCFF_terminal / (WACC - g), where FCFF_terminal = FCFF_current * (1 + g)
+    if wacc <= terminal_growth:
+        terminal_value = float('inf')
+    else:
+        terminal_value = (fcff * (1 + terminal_growth)) / (wacc - terminal_growth)
+
+    # Present value of terminal value: TV / (1+WACC)^N, with the discount factor taken
+    # as exp(-N × log1p(WACC)) so small rates are not rounded through 1 + WACC
+    pv_terminal = terminal_value * math.exp(-projection_years * math.log1p(wacc))
+    return sum_pv_fcff, terminal_value, pv_terminal
+
+
 class ValuationEngine:
     """
     Enterprise valuation engine implementing industry-standard financial models.
@@ -168,6 +239,7 @@ class ValuationEngine:
     - Weighted Average Cost of Capital (WACC)
     - Enhanced analytics (ROIC, ROE, payout ratios)
     - Scenario analysis and stress testing
+    - Batch EPV/DCF/WACC over column arrays for sweeps
     - Comprehensive error handling and validation
     """
 
@@ -199,15 +271,10 @@ class ValuationEngine:
         Raises:
             No exceptions - all validation handled in input models
         """
-        # Calculate cost of equity using CAPM
-        cost_of_equity = inputs.risk_free_rate + (inputs.beta * inputs.market_risk_premium)
-
-        # Calculate after-tax cost of debt
-        cost_of_debt_after_tax = inputs.cost_of_debt * (1 - inputs.tax_rate)
-
-        # Calculate WACC as weighted average
-        wacc = (inputs.equity_weight * cost_of_equity) + \
-               (inputs.debt_weight * cost_of_debt_after_tax)
+        wacc, cost_of_equity, cost_of_debt_after_tax = _wacc_kernel(
+            inputs.risk_free_rate, inputs.market_risk_premium, inputs.beta,
+            inputs.cost_of_debt, inputs.tax_rate, inputs.debt_weight, inputs.equity_weight
+        )
 
         if trace is not None:
             trace.append({
@@ -270,6 +337,11 @@ class ValuationEngine:
         Raises:
             ZeroDivisionError: If WACC is zero (handled by returning infinity)
         """
+        return self._epv_given_wacc(inputs, self.calculate_wacc(inputs, trace), trace)
+
+    def _epv_given_wacc(self, inputs: ValuationInputs, wacc: float,
+                        trace: Optional[List[Dict[str, Any]]] = None) -> float:
+        """calculate_epv with the WACC already computed (and traced) by the caller."""
         # Option A: CFO-based EPV (transparent when audited CFO is used as FCFF proxy)
         if inputs.fcf_mode == 'use_cfo' and inputs.cash_from_operations is not None:
             fcff = inputs.cash_from_operations
@@ -281,7 +353,6 @@ class ValuationEngine:
                     'value': fcff,
                     'rationale': 'Using audited cash from operations as proxy for FCFF (assumes ΔNWC ≈ 0 and maintenance D&A ≈ capex).'
                 })
-            wacc = self.calculate_wacc(inputs, trace)
             if wacc <= 0:
                 return float('inf')
             epv = fcff / wacc
@@ -321,7 +392,6 @@ class ValuationEngine:
                 'value': free_cash_flow
             })
 
-        wacc = self.calculate_wacc(inputs, trace)
         if wacc <= 0:
             return float('inf')  # Avoid division by zero
 
@@ -341,10 +411,17 @@ class ValuationEngine:
 
         Projects free cash flows for 5 years + terminal value.
         """
-        wacc = self.calculate_wacc(inputs, trace)
+        return self._dcf_given_wacc(inputs, self.calculate_wacc(inputs, trace), trace)
+
+    def _dcf_given_wacc(self, inputs: ValuationInputs, wacc: float,
+                        trace: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """calculate_dcf with the WACC already computed (and traced) by the caller."""
         if wacc <= 0:
             return {"dcf_value": float('inf'), "components": {}}
 
+        terminal_growth = inputs.terminal_growth
+        years = inputs.projection_years
+
         # Base FCFF
         if inputs.fcf_mode == 'use_cfo' and inputs.cash_from_operations is not None:
             fcff = inputs.cash_from_operations
@@ -360,61 +437,57 @@ class ValuationEngine:
             # FCFF using steady-state assumption where maintenance capex ≈ D&A
             # FCFF ≈ NOPAT when ΔNWC ~ 0 and D&A ≈ maintenance capex
             # NOPAT = (EBITDA - maintenance_capex) × (1 - tax_rate)
-            normalized_ebit = inputs.ebitda - inputs.maintenance_capex
-            fcff = normalized_ebit * (1 - inputs.tax_rate)
+            ebitda, maintenance_capex, tax_rate = inputs.ebitda, inputs.maintenance_capex, inputs.tax_rate
+            normalized_ebit = ebitda - maintenance_capex
+            fcff = normalized_ebit * (1 - tax_rate)
             if trace is not None:
                 trace.append({
                     'name': 'Base FCFF',
                     'formula': '(EBITDA - Maintenance Capex) × (1 - Tax Rate)',
-                    'inputs': { 'EBITDA': inputs.ebitda, 'Maintenance Capex': inputs.maintenance_capex, 'Tax Rate': inputs.tax_rate },
+                    'inputs': { 'EBITDA': ebitda, 'Maintenance Capex': maintenance_capex, 'Tax Rate': tax_rate },
                     'value': fcff
                 })
 
-        # Project cash flows (simplified - constant growth)
+        sum_pv_fcff, terminal_value, pv_terminal = _dcf_kernel(
+            fcff, wacc, terminal_growth, years
+        )
+
+        # Per-year PVs for the components and trace (simplified - constant growth):
+        # PV_t = FCFF_0 × ((1+g)/(1+WACC))^t, each year one multiply from the last
+        growth_discount = (1 + terminal_growth) / (1 + wacc)
         projected_fcffs = []
-        for year in range(1, inputs.projection_years + 1):
-            projected_fcff = fcff * (1 + inputs.terminal_growth) ** year
-            pv_fcff = projected_fcff / (1 + wacc) ** year
+        pv_fcff = fcff
+        for _ in range(years):
+            pv_fcff *= growth_discount
             projected_fcffs.append(pv_fcff)
-            if trace is not None:
+        if trace is not None:
+            for year, pv_fcff in enumerate(projected_fcffs, 1):
                 trace.append({
                     'name': f'Year {year} FCFF PV',
                     'formula': f'FCFF_{year} = FCFF_0 × (1+g)^{year}; PV = FCFF_{year} / (1+WACC)^{year}',
-                    'inputs': { 'FCFF_0': fcff, 'g': inputs.terminal_growth, 'WACC': wacc },
+                    'inputs': { 'FCFF_0': fcff, 'g': terminal_growth, 'WACC': wacc },
                     'value': pv_fcff
                 })
-
-        # Terminal value using Gordon Growth Model
-        # TV = FCFF_terminal / (WACC - g)
-        # where FCFF_terminal = FCFF_current * (1 + g)
-        if wacc <= inputs.terminal_growth:
-            terminal_value = float('inf')
-        else:
-            terminal_value = (fcff * (1 + inputs.terminal_growth)) / (wacc - inputs.terminal_growth)
-            if trace is not None:
+            if wacc > terminal_growth:
                 trace.append({
                     'name': 'Terminal value (un-discounted)',
                     'formula': 'TV = FCFF_terminal / (WACC - g)',
-                    'inputs': { 'FCFF_terminal': fcff * (1 + inputs.terminal_growth), 'WACC': wacc, 'g': inputs.terminal_growth },
+                    'inputs': { 'FCFF_terminal': fcff * (1 + terminal_growth), 'WACC': wacc, 'g': terminal_growth },
                     'value': terminal_value
                 })
-
-        # Present value of terminal value
-        pv_terminal = terminal_value / (1 + wacc) ** inputs.projection_years
-        if trace is not None:
             trace.append({
                 'name': 'PV of terminal value',
                 'formula': 'PV_TV = TV / (1 + WACC)^N',
-                'inputs': { 'TV': terminal_value, 'WACC': wacc, 'N': inputs.projection_years },
+                'inputs': { 'TV': terminal_value, 'WACC': wacc, 'N': years },
                 'value': pv_terminal
             })
 
-        dcf_value = sum(projected_fcffs) + pv_terminal
+        dcf_value = sum_pv_fcff + pv_terminal
         if trace is not None:
             trace.append({
                 'name': 'DCF enterprise value',
                 'formula': 'Σ PV(FCFF) + PV(TV)',
-                'inputs': { 'sum_pv_fcff': sum(projected_fcffs), 'pv_terminal': pv_terminal },
+                'inputs': { 'sum_pv_fcff': sum_pv_fcff, 'pv_terminal': pv_terminal },
                 'value': dcf_value
             })
 
@@ -431,46 +504,59 @@ class ValuationEngine:
         """
         Apply scenario adjustments to valuation inputs.
         """
-        adjusted_inputs = inputs.model_copy()
+        return inputs.model_copy(update=self._scenario_updates(inputs, scenario))
 
+    @staticmethod
+    def _scenario_updates(inputs: ValuationInputs, scenario: ValuationScenario) -> Dict[str, float]:
+        """The input fields a scenario changes, with their adjusted values."""
         # Apply rate changes (bps)
         rate_change = scenario.rate_bps_change / 10000  # Convert bps to decimal
-        adjusted_inputs.risk_free_rate += rate_change
-        adjusted_inputs.cost_of_debt += rate_change
 
-        # Apply throughput changes (affects EBITDA)
+        # Throughput changes and the EBITDA uplift/drag both scale EBITDA; fold them
+        # into one multiplier so EBITDA is rounded once
         ebitda_change = scenario.throughput_pct_change / 100
-        adjusted_inputs.ebitda *= (1 + ebitda_change)
-
-        # Apply EBITDA uplift/drag
-        adjusted_inputs.ebitda *= (1 + scenario.ebitda_uplift)
+        ebitda_multiplier = (1 + ebitda_change) * (1 + scenario.ebitda_uplift)
+        ebitda = inputs.ebitda * ebitda_multiplier
 
-        return adjusted_inputs
+        return {
+            'risk_free_rate': inputs.risk_free_rate + rate_change,
+            'cost_of_debt': inputs.cost_of_debt + rate_change,
+            'ebitda': ebitda,
+        }
 
     def calculate_valuation(self, inputs: ValuationInputs,
                           scenario: Optional[ValuationScenario] = None) -> ValuationResults:
         """
         Calculate complete valuation including scenarios.
         """
-        # Apply scenario if provided
-        valuation_inputs = inputs
+        # Read fields from the tuple form; apply the scenario to it if provided
+        valuation_inputs = inputs.to_fast() if isinstance(inputs, ValuationInputs) else inputs
         if scenario:
-            valuation_inputs = self.apply_scenario(inputs, scenario)
+            valuation_inputs = valuation_inputs._replace(**self._scenario_updates(valuation_inputs, scenario))
 
-        # Calculate valuations using scenario-adjusted inputs
+        # Calculate valuations using scenario-adjusted inputs; WACC is computed (and
+        # traced) once and shared by EPV and DCF
         trace: List[Dict[str, Any]] = []
         wacc = self.calculate_wacc(valuation_inputs, trace)
-        epv = self.calculate_epv(valuation_inputs, trace)
-        dcf_result = self.calculate_dcf(valuation_inputs, trace)
+        epv = self._epv_given_wacc(valuation_inputs, wacc, trace)
+        dcf_result = self._dcf_given_wacc(valuation_inputs, wacc, trace)
+
+        # Read each field once
+        v = valuation_inputs
+        ebitda, net_debt, tax_rate = v.ebitda, v.net_debt, v.tax_rate
+        cost_of_debt = v.cost_of_debt
+        shareholder_equity, net_income = v.shareholder_equity, v.net_income
+        shares_outstanding, share_price = v.shares_outstanding, v.share_price
+        dividend_per_share, interest_expense = v.dividend_per_share, v.interest_expense
 
-        cost_of_equity = valuation_inputs.risk_free_rate + (valuation_inputs.beta * valuation_inputs.market_risk_premium)
-        cost_of_debt_after_tax = valuation_inputs.cost_of_debt * (1 - valuation_inputs.tax_rate)
+        cost_of_equity = v.risk_free_rate + (v.beta * v.market_risk_premium)
+        cost_of_debt_after_tax = cost_of_debt * (1 - tax_rate)
 
         # Ratios
         # EV/EBITDA = (Enterprise Value) / EBITDA = (EPV + Net Debt) / EBITDA
-        enterprise_value = epv + valuation_inputs.net_debt
-        ev_ebitda_ratio = enterprise_value / valuation_inputs.ebitda if valuation_inputs.ebitda != 0 else 0
-        net_debt_ebitda_ratio = valuation_inputs.net_debt / valuation_inputs.ebitda if valuation_inputs.ebitda != 0 else 0
+        enterprise_value = epv + net_debt
+        ev_ebitda_ratio = enterprise_value / ebitda if ebitda != 0 else 0
+        net_debt_ebitda_ratio = net_debt / ebitda if ebitda != 0 else 0
 
         # Additional metrics calculations
         roic = None
@@ -482,50 +568,46 @@ class ValuationEngine:
 
         # Calculate additional metrics if we have the required data
         # ROIC = NOPAT / (Invested Capital). Use book-based proxy: Net Debt + Shareholder Equity.
-        if valuation_inputs.ebitda and valuation_inputs.shareholder_equity is not None:
-            normalized_ebit_roic = valuation_inputs.ebitda - valuation_inputs.maintenance_capex
-            nopat_roic = normalized_ebit_roic * (1 - valuation_inputs.tax_rate)
-            invested_capital = (valuation_inputs.net_debt or 0.0) + valuation_inputs.shareholder_equity
+        if ebitda and shareholder_equity is not None:
+            normalized_ebit_roic = ebitda - v.maintenance_capex
+            nopat_roic = normalized_ebit_roic * (1 - tax_rate)
+            invested_capital = (net_debt or 0.0) + shareholder_equity
             roic = (nopat_roic / invested_capital) if invested_capital else None
 
         # ROE = Net Income / Shareholder Equity (use actual shareholder equity if available)
-        if valuation_inputs.net_income and hasattr(valuation_inputs, 'shareholder_equity') and valuation_inputs.shareholder_equity:
-            roe = valuation_inputs.net_income / valuation_inputs.shareholder_equity if valuation_inputs.shareholder_equity != 0 else None
+        if net_income and shareholder_equity:
+            roe = net_income / shareholder_equity
 
-        if valuation_inputs.dividend_per_share and valuation_inputs.net_income and valuation_inputs.shares_outstanding:
+        if dividend_per_share and net_income and shares_outstanding:
             # Payout Ratio = Dividends / Net Income
-            annual_dividends = valuation_inputs.dividend_per_share * valuation_inputs.shares_outstanding
-            payout_ratio = annual_dividends / valuation_inputs.net_income if valuation_inputs.net_income != 0 else None
+            annual_dividends = dividend_per_share * shares_outstanding
+            payout_ratio = annual_dividends / net_income
 
-        if valuation_inputs.dividend_per_share and valuation_inputs.share_price:
+        if dividend_per_share and share_price:
             # Dividend Yield = Annual Dividend / Share Price
-            dividend_yield = valuation_inputs.dividend_per_share / valuation_inputs.share_price
+            dividend_yield = dividend_per_share / share_price
 
         # Debt-to-Equity = Total Debt / Shareholder Equity
         # Use actual shareholder equity if available, otherwise calculate from market data
-        if valuation_inputs.net_debt:
-            if hasattr(valuation_inputs, 'shareholder_equity') and valuation_inputs.shareholder_equity and valuation_inputs.shareholder_equity > 0:
+        if net_debt:
+            if shareholder_equity and shareholder_equity > 0:
                 # Use actual shareholder equity from financial data
-                debt_to_equity = valuation_inputs.net_debt / valuation_inputs.shareholder_equity
-            elif valuation_inputs.shares_outstanding and valuation_inputs.share_price and valuation_inputs.shares_outstanding > 0 and valuation_inputs.share_price > 0:
+                debt_to_equity = net_debt / shareholder_equity
+            elif shares_outstanding and share_price and shares_outstanding > 0 and share_price > 0:
                 # Fallback to market-based calculation
-                shareholder_equity_market = valuation_inputs.shares_outstanding * valuation_inputs.share_price
-                debt_to_equity = valuation_inputs.net_debt / shareholder_equity_market if shareholder_equity_market != 0 else None
-            else:
-                debt_to_equity = None
+                shareholder_equity_market = shares_outstanding * share_price
+                debt_to_equity = net_debt / shareholder_equity_market if shareholder_equity_market != 0 else None
 
         # Interest Coverage = EBITDA / Interest Expense
         # Use actual interest expense if available (from financial data), otherwise approximate
-        if valuation_inputs.ebitda:
-            if hasattr(valuation_inputs, 'interest_expense') and valuation_inputs.interest_expense and valuation_inputs.interest_expense > 0:
+        if ebitda:
+            if interest_expense and interest_expense > 0:
                 # Use actual interest expense from financial data
-                interest_coverage = valuation_inputs.ebitda / valuation_inputs.interest_expense
-            elif valuation_inputs.net_debt and valuation_inputs.cost_of_debt:
+                interest_coverage = ebitda / interest_expense
+            elif net_debt and cost_of_debt:
                 # Fallback to approximation: cost_of_debt * net_debt
-                interest_expense_approx = valuation_inputs.cost_of_debt * valuation_inputs.net_debt
-                interest_coverage = valuation_inputs.ebitda / interest_expense_approx if interest_expense_approx != 0 else None
-            else:
-                interest_coverage = None
+                interest_expense_approx = cost_of_debt * net_debt
+                interest_coverage = ebitda / interest_expense_approx if interest_expense_approx != 0 else None
 
         results = ValuationResults(
             epv=epv,
@@ -541,20 +623,92 @@ class ValuationEngine:
             dividend_yield=dividend_yield,
             debt_to_equity=debt_to_equity,
             interest_coverage=interest_coverage,
+            # The base figures above already use the scenario-adjusted inputs
+            scenario_epv=epv if scenario else None,
+            scenario_dcf=dcf_result["dcf_value"] if scenario else None,
             dcf_components=dcf_result["components"],
             calculation_trace=trace
         )
 
-        # Apply scenario if provided
-        if scenario:
-            adjusted_inputs = self.apply_scenario(inputs, scenario)
-            scenario_epv = self.calculate_epv(adjusted_inputs)
-            scenario_dcf_result = self.calculate_dcf(adjusted_inputs)
+        return results
 
-            results.scenario_epv = scenario_epv
-            results.scenario_dcf = scenario_dcf_result["dcf_value"]
+    # Columns read by calculate_valuation_batch, in kernel argument order
+    BATCH_FIELDS = (
+        'ebitda', 'net_debt', 'maintenance_capex', 'tax_rate', 'reinvestment_rate',
+        'risk_free_rate', 'market_risk_premium', 'beta', 'cost_of_debt',
+        'debt_weight', 'equity_weight', 'terminal_growth', 'projection_years',
+    )
 
-        return results
+    def calculate_valuation_batch(self, arrays: Mapping[str, Sequence[float]],
+                                  typecode: str = 'd') -> Dict[str, array]:
+        """
+        Calculate EPV, DCF and WACC for many input sets from column arrays.
+
+        One call values a whole batch (companies, sensitivity grid points) through the
+        plain-float kernels, without building a ValuationInputs per row.
+
+        Args:
+            arrays: ValuationInputs field names mapped to equal-length sequences (lists,
+                    array('d'), NumPy arrays, ...). ebitda, net_debt and
+                    maintenance_capex are required; other fields in BATCH_FIELDS default to the
+                    ValuationInputs defaults. Rows are not validated, and FCFF always
+                    uses the standard (EBITDA - maintenance capex) definition.
+            typecode: Result array type, 'd' (float64) or 'f' (float32). float32 halves
+                      the memory of large sensitivity grids; the math still runs in
+                      float64 and only the stored results are rounded.
+
+        Returns:
+            Dict with typecode arrays 'epv', 'dcf_value', 'wacc', 'ev_ebitda_ratio' and
+            'net_debt_ebitda_ratio', one entry per row (ratios are 0 where EBITDA is 0)
+
+        Raises:
+            ValueError: If a required column is missing, column lengths differ or
+                        typecode is not 'd' or 'f'
+        """
+        if typecode not in ('d', 'f'):
+            raise ValueError(f"Unsupported result typecode: {typecode!r}")
+
+        size = len(arrays['ebitda']) if 'ebitda' in arrays else 0
+        columns = []
+        for name in self.BATCH_FIELDS:
+            column = arrays.get(name)
+            if column is None:
+                field = ValuationInputs.model_fields[name]
+                if field.is_required():
+                    raise ValueError(f"Missing required column: {name}")
+                column = repeat(field.default, size)
+            elif len(column) != size:
+                raise ValueError(f"Column {name} has {len(column)} rows, expected {size}")
+            columns.append(column)
+
+        epvs, dcf_values, waccs = array(typecode), array(typecode), array(typecode)
+        ev_ebitda_ratios, net_debt_ebitda_ratios = array(typecode), array(typecode)
+        for (ebitda, net_debt, maintenance_capex, tax_rate, reinvestment_rate, risk_free_rate,
+             market_risk_premium, beta, cost_of_debt, debt_weight, equity_weight,
+             terminal_growth, projection_years) in zip(*columns):
+            wacc, _, _ = _wacc_kernel(risk_free_rate, market_risk_premium, beta, cost_of_debt,
+                                      tax_rate, debt_weight, equity_weight)
+            nopat = (ebitda - maintenance_capex) * (1 - tax_rate)
+            if wacc <= 0:
+                epv = dcf_value = float('inf')
+            else:
+                epv = nopat * (1 - reinvestment_rate) / wacc
+                sum_pv_fcff, _, pv_terminal = _dcf_kernel(nopat, wacc, terminal_growth, projection_years)
+                dcf_value = sum_pv_fcff + pv_terminal
+            epvs.append(epv)
+            dcf_values.append(dcf_value)
+            waccs.append(wacc)
+            # Same guards as calculate_valuation: EV = EPV + net debt
+            ev_ebitda_ratios.append((epv + net_debt) / ebitda if ebitda != 0 else 0.0)
+            net_debt_ebitda_ratios.append(net_debt / ebitda if ebitda != 0 else 0.0)
+
+        return {
+            'epv': epvs,
+            'dcf_value': dcf_values,
+            'wacc': waccs,
+            'ev_ebitda_ratio': ev_ebitda_ratios,
+            'net_debt_ebitda_ratio': net_debt_ebitda_ratios,
+        }
 
 
 def create_sample_inputs() -> ValuationInputs:
@@ -3,25 +3,40 @@ FastAPI backend for Energy IC Copilot.
 Provides endpoints for KPI extraction, valuation calculations, and data management.
 """
 
-import sys
+import asyncio
+import hashlib
+import importlib.util
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Any
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, UploadFile, File, Request, Response
 from fastapi import Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 import yaml
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLLoader
 import tempfile
+import shutil
 import os
-
-# Add the current directory to Python path to import core modules
-sys.path.insert(0, str(Path(__file__).parent))
-
-# Import core modules
-from core.extract import KPIExtractor, extract_kpis_from_filings  # noqa: E402
-from core.valuation import ValuationEngine, ValuationInputs, ValuationScenario, ValuationResults  # noqa: E402
-from core.cite import Citation  # noqa: E402,F401
-from core.data_manager import create_data_manager  # noqa: E402
+import httpx
+
+# Import core modules: package-relative when loaded as apps.api.main, top-level when served
+# as ``main:app`` from this directory (uvicorn/gunicorn put the app dir on sys.path). Chosen
+# by __package__ so an ImportError raised inside core itself is never masked.
+if __package__:
+    from .core.extract import KPIExtractor, extract_kpis_from_filings
+    from .core.valuation import ValuationEngine, ValuationInputs, ValuationScenario, ValuationResults
+    from .core.data_manager import create_data_manager
+else:
+    from core.extract import KPIExtractor, extract_kpis_from_filings
+    from core.valuation import ValuationEngine, ValuationInputs, ValuationScenario, ValuationResults
+    from core.data_manager import create_data_manager
 
 # Configuration
 PROJECT_ROOT = Path(__file__).parent
@@ -29,13 +44,54 @@ DATA_DIR = PROJECT_ROOT / "data"
 FILINGS_DIR = DATA_DIR / "filings"
 MAPPINGS_PATH = DATA_DIR / "mappings.yaml"
 COMPANIES_PATH = DATA_DIR / "companies.yaml"
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+MAX_UPLOAD_BYTES = 50 << 20  # 50 MiB cap on the /ingest request body
+# Upper bound on per-request extraction/valuation work. A timed-out worker thread still
+# finishes in the background, but the client and event loop are released.
+COMPUTE_TIMEOUT_SECONDS = 15.0
+
+# httpx only decodes Brotli (smaller companyfacts payloads) when a decoder is installed
+ACCEPT_ENCODING = (
+    "br, gzip, deflate"
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+    else "gzip, deflate"
+)
+
+def new_http_client() -> httpx.AsyncClient:
+    """Build the shared client used for outbound SEC calls."""
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        headers={"Accept-Encoding": ACCEPT_ENCODING},
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared async resources on startup and close them on shutdown."""
+    # Shared HTTP client so outbound SEC calls reuse connections and don't block the event loop
+    app.state.http = new_http_client()
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
 
 app = FastAPI(
     title="Energy IC Copilot API",
     description="Backend API for energy infrastructure company analysis and valuation",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson encodes the KPI/valuation payloads considerably faster than the stdlib encoder
+    default_response_class=ORJSONResponse if importlib.util.find_spec("orjson") else JSONResponse,
 )
 
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it when the app runs without its lifespan."""
+    http = getattr(app.state, "http", None)
+    if http is None:
+        http = app.state.http = new_http_client()
+    return http
+
 # Environment-based CORS configuration
 
 def get_cors_origins():
@@ -70,6 +126,44 @@ def get_cors_origins():
             "http://127.0.0.1:3001",
         ]
 
+class UploadLimitMiddleware:
+    """Reject request bodies over ``max_bytes`` on ``path`` before they are parsed.
+
+    A declared Content-Length is checked up front; chunked bodies are counted as they
+    arrive, so an oversized upload is never fully spooled to disk.
+    """
+
+    def __init__(self, app, path: str, max_bytes: int):
+        self.app = app
+        self.path = path
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] != self.path:
+            await self.app(scope, receive, send)
+            return
+
+        detail = f"Upload exceeds {self.max_bytes >> 20} MiB limit"
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and (not content_length.isdigit() or int(content_length) > self.max_bytes):
+            await JSONResponse({"detail": detail}, status_code=413)(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+app.add_middleware(UploadLimitMiddleware, path="/ingest", max_bytes=MAX_UPLOAD_BYTES)
+
 # CORS middleware with environment-based configuration
 app.add_middleware(
     CORSMiddleware,
@@ -80,8 +174,13 @@ app.add_middleware(
     max_age=86400,  # Cache preflight requests for 24 hours
 )
 
-# Pydantic models for API
+# Pydantic models for API. Instances are immutable (CompanyInfo objects are shared by the
+# companies cache) and unknown fields are dropped rather than validated.
+API_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
 class CompanyInfo(BaseModel):
+    model_config = API_MODEL_CONFIG
+
     name: str
     ticker: str
     currency: str
@@ -90,11 +189,15 @@ class CompanyInfo(BaseModel):
     country: str
 
 class KPISummary(BaseModel):
+    model_config = API_MODEL_CONFIG
+
     ticker: str
     kpis: Dict[str, Dict[str, Any]]
     extracted_at: str
 
 class ValuationRequest(BaseModel):
+    model_config = API_MODEL_CONFIG
+
     ticker: str
     inputs: ValuationInputs
     scenario: Optional[ValuationScenario] = None
@@ -103,37 +206,86 @@ class ValuationRequest(BaseModel):
 valuation_engine = ValuationEngine()
 data_manager = create_data_manager(DATA_DIR)
 
+# YAML data files are parsed once per file version (mtime) and served from memory
+@lru_cache(maxsize=8)
+def _load_yaml(path: Path, mtime_ns: int) -> Any:
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=YAMLLoader)
+
+def load_yaml_cached(path: Path) -> Any:
+    """Load a YAML file, re-parsing only when it changes on disk."""
+    return _load_yaml(path, path.stat().st_mtime_ns)
+
+@lru_cache(maxsize=4)
+def _build_companies(mtime_ns: int) -> Dict[str, CompanyInfo]:
+    companies_data = _load_yaml(COMPANIES_PATH, mtime_ns)
+    return {ticker: CompanyInfo(**info) for ticker, info in companies_data.items()}
+
+def get_companies_cached() -> Dict[str, CompanyInfo]:
+    """Get validated company records, rebuilt only when companies.yaml changes."""
+    return _build_companies(COMPANIES_PATH.stat().st_mtime_ns)
+
+@lru_cache(maxsize=1)
+def _build_kpi_extractor(mtime_ns: int) -> KPIExtractor:
+    return KPIExtractor(MAPPINGS_PATH)
+
+def get_kpi_extractor() -> KPIExtractor:
+    """Get the shared KPI extractor, rebuilt only when mappings.yaml changes."""
+    return _build_kpi_extractor(MAPPINGS_PATH.stat().st_mtime_ns)
+
+# Conditional GET: responses derived from data files carry a weak ETag of those files'
+# versions, so polling clients get a bodyless 304 until something changes on disk
+CACHE_CONTROL = "public, max-age=60"
+
+def files_etag(*paths: Path) -> str:
+    """Weak ETag over the path, mtime and size of each source file."""
+    digest = hashlib.blake2b(digest_size=8)
+    for path in paths:
+        stat = path.stat()
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+    return f'W/"{digest.hexdigest()}"'
+
+def check_etag(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client already has ``etag``, else tag ``response``."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison: W/ prefixes are ignored on both sides
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in candidates or etag.removeprefix("W/") in candidates:
+            return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
     return {"message": "Energy IC Copilot API", "status": "healthy"}
 
 @app.get("/companies", response_model=Dict[str, CompanyInfo])
-async def get_companies():
+async def get_companies(request: Request, response: Response):
     """Get all available companies."""
     try:
-        with open(COMPANIES_PATH, 'r') as f:
-            companies_data = yaml.safe_load(f)
-
-        companies = {}
-        for ticker, info in companies_data.items():
-            companies[ticker] = CompanyInfo(**info)
-
-        return companies
+        not_modified = check_etag(request, response, files_etag(COMPANIES_PATH))
+        if not_modified:
+            return not_modified
+        return get_companies_cached()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading companies: {str(e)}")
 
 @app.get("/companies/{ticker}", response_model=CompanyInfo)
-async def get_company(ticker: str):
+async def get_company(ticker: str, request: Request, response: Response):
     """Get information for a specific company."""
     try:
-        with open(COMPANIES_PATH, 'r') as f:
-            companies_data = yaml.safe_load(f)
+        companies = get_companies_cached()
 
-        if ticker not in companies_data:
+        if ticker not in companies:
             raise HTTPException(status_code=404, detail=f"Company {ticker} not found")
 
-        return CompanyInfo(**companies_data[ticker])
+        not_modified = check_etag(request, response, files_etag(COMPANIES_PATH))
+        if not_modified:
+            return not_modified
+        return companies[ticker]
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Companies data not found")
     except HTTPException:
@@ -157,18 +309,23 @@ async def ingest_document(file: UploadFile = File(...), ticker: str = None):
         raise HTTPException(status_code=400, detail="No file provided")
 
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file.filename) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
+        # Stream the upload to a temp file in fixed-size chunks; only the extension is kept
+        # so the extractor can pick its reader
+        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as temp_file:
             temp_file_path = Path(temp_file.name)
+            await asyncio.to_thread(shutil.copyfileobj, file.file, temp_file, UPLOAD_CHUNK_SIZE)
 
-        # Extract KPIs
-        extractor = KPIExtractor(MAPPINGS_PATH)
-        extracted_kpis = extractor.extract_from_file(temp_file_path, ticker)
-
-        # Clean up temp file
-        os.unlink(temp_file_path)
+        try:
+            # Extract KPIs (regex/disk work runs in a worker thread so the event loop stays free)
+            extractor = get_kpi_extractor()
+            extracted_kpis = await asyncio.wait_for(
+                # The temp file is deleted right after, so keep it out of the read cache
+                asyncio.to_thread(extractor.extract_from_file, temp_file_path, ticker, cache=False),
+                timeout=COMPUTE_TIMEOUT_SECONDS,
+            )
+        finally:
+            # Clean up temp file
+            os.unlink(temp_file_path)
 
         # Convert to response format
         response_kpis = {}
@@ -186,15 +343,23 @@ async def ingest_document(file: UploadFile = File(...), ticker: str = None):
             "status": "processed"
         }
 
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=408, detail="Document processing timed out")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing document: {str(e)}")
 
 @app.get("/kpis/{ticker}", response_model=KPISummary)
-async def get_kpis(ticker: str):
+async def get_kpis(ticker: str, request: Request, response: Response):
     """Get latest KPIs for a company from sample filings."""
     try:
+        # KPIs depend only on the mappings and this ticker's filings
+        sources = [MAPPINGS_PATH, *sorted(FILINGS_DIR.glob(f"{ticker.lower()}_*.txt"))]
+        not_modified = check_etag(request, response, files_etag(*sources))
+        if not_modified:
+            return not_modified
+
         # Extract from sample filings
-        extracted_kpis = extract_kpis_from_filings(FILINGS_DIR, MAPPINGS_PATH, ticker)
+        extracted_kpis = await asyncio.to_thread(extract_kpis_from_filings, FILINGS_DIR, MAPPINGS_PATH, ticker)
 
         # Convert to response format
         response_kpis = {}
@@ -205,11 +370,10 @@ async def get_kpis(ticker: str):
                 "citation": kpi_data.citation.to_dict()
             }
 
-        import datetime
         return KPISummary(
             ticker=ticker,
             kpis=response_kpis,
-            extracted_at=datetime.datetime.now().isoformat()
+            extracted_at=datetime.now(timezone.utc).isoformat(timespec="seconds")
         )
 
     except Exception as e:
@@ -224,30 +388,42 @@ async def calculate_valuation(ticker: str, request: ValuationRequest):
             raise HTTPException(status_code=400, detail="Ticker mismatch")
 
         # Calculate valuation
-        results = valuation_engine.calculate_valuation(
-            inputs=request.inputs,
-            scenario=request.scenario
+        results = await asyncio.wait_for(
+            asyncio.to_thread(
+                valuation_engine.calculate_valuation,
+                inputs=request.inputs,
+                scenario=request.scenario
+            ),
+            timeout=COMPUTE_TIMEOUT_SECONDS,
         )
 
         return results
 
+    except HTTPException:
+        raise
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=408, detail="Valuation timed out")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calculating valuation: {str(e)}")
 
 @app.get("/mappings/{ticker}")
-async def get_mappings(ticker: str):
+async def get_mappings(ticker: str, request: Request, response: Response):
     """Get KPI extraction mappings for a company."""
     try:
-        with open(MAPPINGS_PATH, 'r') as f:
-            mappings = yaml.safe_load(f)
+        mappings = load_yaml_cached(MAPPINGS_PATH)
 
         if ticker not in mappings:
             raise HTTPException(status_code=404, detail=f"No mappings found for {ticker}")
 
+        not_modified = check_etag(request, response, files_etag(MAPPINGS_PATH))
+        if not_modified:
+            return not_modified
         return mappings[ticker]
 
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Mappings file not found")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading mappings: {str(e)}")
 
@@ -255,7 +431,7 @@ async def get_mappings(ticker: str):
 async def get_xbrl_metrics(ticker: str, period: str = Query("any", regex="^(?i)(any|ytd|qtd|quarter)$")):
     """Return standardized SEC XBRL metrics (millions) for a ticker."""
     try:
-        res = data_manager.get_latest_financials_xbrl(ticker, period=period)
+        res = await data_manager.aget_latest_financials_xbrl(ticker, get_http_client(), period=period)
         if not res:
             raise HTTPException(status_code=404, detail="XBRL metrics not available")
         return res
@@ -289,9 +465,10 @@ async def health_check():
 
     # Check core modules
     core_modules = ["extract", "valuation", "cite"]
+    core_package = f"{__package__}.core" if __package__ else "core"
     for module in core_modules:
         try:
-            __import__(f"core.{module}")
+            importlib.import_module(f"{core_package}.{module}")
             health_status["core_modules"][module] = "loaded"
         except ImportError:
             health_status["core_modules"][module] = "missing"
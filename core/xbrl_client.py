@@ -13,31 +13,360 @@ Notes:
 
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
 import requests
-from typing import Any, Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast path
+    orjson = None
+
+try:  # urllib3 only decodes Brotli bodies when one of these is installed
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "br, gzip, deflate"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+if TYPE_CHECKING:
+    import httpx
+
+
+# One pooled session shared by every XBRLClient so TCP/TLS connections are reused
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _shared_session() -> requests.Session:
+    """Return the process-wide SEC session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=32,
+                    pool_maxsize=64,
+                    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({"Accept-Encoding": _ACCEPT_ENCODING})
+                _SESSION = session
+    return _SESSION
+
+
+# Default location for raw companyfacts payloads and their validators
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "edgar" / "companyfacts"
+
 
 class XBRLClient:
     BASE_URL = "https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json"
+    # SEC refreshes companyfacts at most daily; within this window no request is made
+    FACTS_TTL = 86400
+
+    def __init__(
+        self,
+        user_agent: str = "EnergyICCopilot/1.0 (admin@energyiccopilot.com)",
+        cache_dir: Optional[Path] = None,
+    ):
+        self.session = _shared_session()
+        # Sent per request since the pooled session is shared across user agents
+        self.headers = {"User-Agent": user_agent}
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+        # cik10 -> (monotonic timestamp, parsed facts)
+        self._facts_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+    def _body_path(self, cik10: str) -> Path:
+        return self.cache_dir / f"CIK{cik10}.json"
+
+    def _validators_path(self, cik10: str) -> Path:
+        return self.cache_dir / f"CIK{cik10}.validators.json"
+
+    def _cached_facts(self, cik10: str) -> Optional[Dict[str, Any]]:
+        """Return facts from memory or a fresh on-disk copy, or None if a request is needed."""
+        cached = self._facts_cache.get(cik10)
+        if cached and time.monotonic() - cached[0] < self.FACTS_TTL:
+            return cached[1]
+        body_path = self._body_path(cik10)
+        try:
+            if time.time() - body_path.stat().st_mtime < self.FACTS_TTL:
+                return self._remember(cik10, body_path.read_bytes())
+        except (OSError, ValueError):
+            pass
+        return None
 
-    def __init__(self, user_agent: str = "EnergyICCopilot/1.0 (admin@energyiccopilot.com)"):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": user_agent,
-            "Accept-Encoding": "gzip, deflate",
-        })
-
-    def _get(self, url: str) -> Dict[str, Any]:
-        resp = self.session.get(url, timeout=30)
-        resp.raise_for_status()
-        return resp.json()
+    def _request_headers(self, cik10: str) -> Dict[str, str]:
+        """Request headers with If-None-Match/If-Modified-Since from the last stored response."""
+        headers = dict(self.headers)
+        if not self._body_path(cik10).exists():
+            return headers
+        try:
+            raw = self._validators_path(cik10).read_bytes()
+            validators = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
+            return headers
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def _store_response(self, cik10: str, status_code: int, content: bytes, headers: Any) -> Dict[str, Any]:
+        """Persist a companyfacts response (or reuse the stored body on 304) and parse it."""
+        body_path = self._body_path(cik10)
+        if status_code == 304:
+            # Validators are only sent when a body is on disk; touch it to restart the TTL
+            os.utime(body_path)
+            return self._remember(cik10, body_path.read_bytes())
+
+        facts = self._remember(cik10, content)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = body_path.with_suffix(".tmp")
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, body_path)
+            validators = {"etag": headers.get("ETag"), "last_modified": headers.get("Last-Modified")}
+            self._validators_path(cik10).write_bytes(
+                orjson.dumps(validators) if orjson is not None else json.dumps(validators).encode("utf-8")
+            )
+        except OSError:
+            pass
+        return facts
+
+    def _remember(self, cik10: str, body: bytes) -> Dict[str, Any]:
+        facts = orjson.loads(body) if orjson is not None else json.loads(body)
+        self._facts_cache[cik10] = (time.monotonic(), facts)
+        return facts
 
     def get_company_facts(self, cik: str) -> Dict[str, Any]:
-        """Fetch companyfacts JSON for a CIK (string of digits, may include leading zeros)."""
+        """Fetch companyfacts JSON for a CIK (string of digits, may include leading zeros).
+
+        Served from memory or disk while fresh; otherwise revalidated with the stored
+        ETag/Last-Modified so an unchanged payload costs a 304 rather than a full download.
+        """
         cik10 = str(cik).zfill(10)
+        facts = self._cached_facts(cik10)
+        if facts is not None:
+            return facts
         url = self.BASE_URL.format(cik=cik10)
-        return self._get(url)
+        resp = self.session.get(url, headers=self._request_headers(cik10), timeout=30)
+        if resp.status_code != 304:
+            resp.raise_for_status()
+        return self._store_response(cik10, resp.status_code, resp.content, resp.headers)
+
+    async def aget_company_facts(self, cik: str, client: "httpx.AsyncClient") -> Dict[str, Any]:
+        """Async variant of get_company_facts using a shared httpx.AsyncClient.
+
+        Disk reads/writes and JSON decoding of the multi-MB payload run in a worker thread.
+        """
+        cik10 = str(cik).zfill(10)
+        facts = await asyncio.to_thread(self._cached_facts, cik10)
+        if facts is not None:
+            return facts
+        url = self.BASE_URL.format(cik=cik10)
+        resp = await client.get(url, headers=await asyncio.to_thread(self._request_headers, cik10))
+        if resp.status_code != 304:
+            resp.raise_for_status()
+        return await asyncio.to_thread(self._store_response, cik10, resp.status_code, resp.content, resp.headers)
+
+
+class _FactSeries(NamedTuple):
+    """Column-oriented view of one (taxonomy, tag, unit) fact list."""
+
+    items: List[Dict[str, Any]]
+    ends: List[int]  # YYYYMMDD
+    form_scores: List[int]  # 1 for 10-Q/10-K, 0 otherwise
+    frame_flags: List[int]  # _FRAME_* bits of the frame label, 0 when absent
+    # end * 1000 + 200 for a preferred form; the per-preference frame score (97-100) is added on top
+    base_scores: List[int]
+    picks: Dict[Tuple[bool, str], int]  # memoized winner per (prefer_quarterly, frame_preference)
+
+
+def _end_key(item: Dict[str, Any]) -> int:
+    """Period end (or filed) date as a sortable YYYYMMDD integer; 00010101 when unparseable."""
+    end = item.get("end") or item.get("filed")
+    if not end:
+        return 10101
+    # SEC dates are always YYYY-MM-DD, so slice the digits instead of building a datetime
+    if isinstance(end, str) and len(end) == 10 and end[4] == "-" and end[7] == "-":
+        try:
+            return int(end[:4]) * 10000 + int(end[5:7]) * 100 + int(end[8:10])
+        except ValueError:
+            pass
+    try:
+        dt = datetime.fromisoformat(end)
+    except (TypeError, ValueError):
+        return 10101
+    return dt.year * 10000 + dt.month * 100 + dt.day
+
+
+def _build_series(items: List[Dict[str, Any]]) -> _FactSeries:
+    ends = [_end_key(item) for item in items]
+    form_scores = [1 if (item.get("form") or "").upper() in ("10-Q", "10-K") else 0 for item in items]
+    return _FactSeries(
+        items=items,
+        ends=ends,
+        form_scores=form_scores,
+        frame_flags=[_frame_flags(item.get("frame")) for item in items],
+        base_scores=[end * 1000 + form * 200 for end, form in zip(ends, form_scores)],
+        picks={},
+    )
+
+
+class _FactsIndex:
+    """Per-(taxonomy, tag, unit) column index over a companyfacts ``facts`` mapping.
+
+    Series are built on first access, so only the ~dozen tags we read are converted
+    rather than the thousands a filer reports.
+    """
+
+    __slots__ = ("facts", "_series")
+
+    def __init__(self, facts: Dict[str, Any]):
+        self.facts = facts
+        self._series: Dict[Tuple[str, str, str], Optional[_FactSeries]] = {}
+
+    def series(self, taxonomy: str, tag: str, unit: str) -> Optional[_FactSeries]:
+        key = (taxonomy, tag, unit)
+        try:
+            return self._series[key]
+        except KeyError:
+            pass
+        t = self.facts.get(taxonomy, {}).get(tag)
+        items = t.get("units", {}).get(unit) if t else None
+        series = _build_series(items) if items else None
+        self._series[key] = series
+        return series
+
+
+# Facts dicts are cached (and treated as read-only) by XBRLClient, so re-parsing the same
+# CIK with another frame preference reuses its index. Keyed by id() with the dict pinned.
+_INDEX_CACHE: "OrderedDict[int, Tuple[Dict[str, Any], _FactsIndex]]" = OrderedDict()
+_INDEX_CACHE_SIZE = 16
+_INDEX_LOCK = threading.Lock()
+
+
+def _index_facts(facts: Dict[str, Any]) -> _FactsIndex:
+    """Return the (cached) column index for a companyfacts ``facts`` mapping."""
+    with _INDEX_LOCK:
+        entry = _INDEX_CACHE.get(id(facts))
+        if entry is not None and entry[0] is facts:
+            _INDEX_CACHE.move_to_end(id(facts))
+            return entry[1]
+        index = _FactsIndex(facts)
+        _INDEX_CACHE[id(facts)] = (facts, index)
+        if len(_INDEX_CACHE) > _INDEX_CACHE_SIZE:
+            _INDEX_CACHE.popitem(last=False)
+        return index
+
+
+# Frame labels are reduced to the four substrings the ranking looks at
+_FRAME_Q = 1
+_FRAME_YTD = 2
+_FRAME_QTD = 4
+_FRAME_ANNUAL = 8  # 'FY' or 'CY'
+
+# SEC uses only a few dozen distinct frame labels, so flags are computed once per label
+_FRAME_FLAGS: Dict[str, int] = {}
+
+
+def _frame_flags(frame: Optional[str]) -> int:
+    if not frame:
+        return 0
+    flags = _FRAME_FLAGS.get(frame)
+    if flags is None:
+        f = frame.upper()
+        flags = ((_FRAME_Q if 'Q' in f else 0)
+                 | (_FRAME_YTD if 'YTD' in f else 0)
+                 | (_FRAME_QTD if 'QTD' in f else 0)
+                 | (_FRAME_ANNUAL if ('FY' in f or 'CY' in f) else 0))
+        _FRAME_FLAGS[frame] = flags
+    return flags
+
+
+def _compute_frame_rank(flags: int, frame_preference: str) -> int:
+    """Rank frame flags against a preference (0 = best, 3 = worst)."""
+    q = bool(flags & _FRAME_Q)
+    ytd = bool(flags & _FRAME_YTD)
+    qtd = bool(flags & _FRAME_QTD)
+    annual = bool(flags & _FRAME_ANNUAL)
+    # Specific preferences
+    if frame_preference == 'YTD':
+        if ytd and q:
+            return 0
+        if qtd:
+            return 1
+        if annual:
+            return 2
+        return 3
+    if frame_preference == 'QTD':
+        if qtd:
+            return 0
+        if ytd and q:
+            return 1
+        if annual:
+            return 2
+        return 3
+    if frame_preference == 'FY':
+        if annual:
+            return 0
+        if ytd and q:
+            return 1
+        if qtd or q:
+            return 2
+        return 3
+    # ANY (default) heuristic
+    if q and ytd:
+        return 0
+    if qtd or q:
+        return 1
+    if annual:
+        return 2
+    return 3
+
+
+# preference -> frame score (100 - rank) for every combination of frame flags
+_FRAME_SCORES: Dict[str, Tuple[int, ...]] = {
+    pref: tuple(100 - _compute_frame_rank(flags, pref) for flags in range(16))
+    for pref in ('ANY', 'YTD', 'QTD', 'FY')
+}
+
+
+def _pick_latest(series: _FactSeries, prefer_quarterly: bool, frame_preference: str) -> int:
+    """Return the position of the preferred item in a series (see _latest_unit_item).
+
+    The (end date, form, frame) ranking is folded into one integer per item so the scan
+    compares plain ints, and the winner is memoized per preference on the series.
+    """
+    key = (prefer_quarterly, frame_preference)
+    pos = series.picks.get(key)
+    if pos is None:
+        if prefer_quarterly:
+            frame_scores = _FRAME_SCORES.get(frame_preference, _FRAME_SCORES['ANY'])
+            scores = [base + frame_scores[flags]
+                      for base, flags in zip(series.base_scores, series.frame_flags)]
+        else:
+            # Frame score is constant for stock metrics, so it cannot change the order
+            scores = series.base_scores
+        # max() keeps the first of equal scores, matching the stable reverse sort it replaced
+        pos = max(range(len(scores)), key=scores.__getitem__)
+        series.picks[key] = pos
+    return pos
 
 
 def _latest_unit_item(
@@ -54,64 +383,7 @@ def _latest_unit_item(
     """
     if not items:
         return None
-
-    def frame_rank(frame: Optional[str]) -> int:
-        if not frame:
-            return 3
-        f = frame.upper()
-        # Specific preferences
-        if frame_preference == 'YTD':
-            if 'YTD' in f and 'Q' in f:
-                return 0
-            if 'QTD' in f or ('Q' in f and 'QTD' in f):
-                return 1
-            if 'FY' in f or 'CY' in f:
-                return 2
-            return 3
-        if frame_preference == 'QTD':
-            if 'QTD' in f or ('Q' in f and 'QTD' in f):
-                return 0
-            if 'YTD' in f and 'Q' in f:
-                return 1
-            if 'FY' in f or 'CY' in f:
-                return 2
-            return 3
-        if frame_preference == 'FY':
-            if 'FY' in f or 'CY' in f:
-                return 0
-            if 'YTD' in f and 'Q' in f:
-                return 1
-            if 'QTD' in f or 'Q' in f:
-                return 2
-            return 3
-        # ANY (default) heuristic
-        if 'Q' in f and 'YTD' in f:
-            return 0
-        if 'QTD' in f or 'Q' in f:
-            return 1
-        if 'FY' in f or 'CY' in f:
-            return 2
-        return 3
-
-    # Convert end date and add ranking
-    def key(item: Dict[str, Any]) -> Tuple[datetime, int, int]:
-        end = item.get("end") or item.get("filed") or "0001-01-01"
-        try:
-            dt = datetime.fromisoformat(end)
-        except Exception:
-            try:
-                dt = datetime.strptime(end, "%Y-%m-%d")
-            except Exception:
-                dt = datetime(1, 1, 1)
-        form = (item.get("form") or "").upper()
-        form_rank = 0 if form in ("10-Q", "10-K") else 1
-        fr_rank = frame_rank(item.get("frame")) if prefer_quarterly else 2
-        # Convert ranks so higher is better under reverse=True
-        form_score = 1 - form_rank  # 1 for preferred, 0 otherwise
-        frame_score = 100 - fr_rank  # higher for better frame preference
-        return (dt, form_score, frame_score)
-
-    return sorted(items, key=key, reverse=True)[0]
+    return items[_pick_latest(_build_series(items), prefer_quarterly, frame_preference)]
 
 
 def _get_fact(
@@ -123,21 +395,7 @@ def _get_fact(
     frame_preference: str = "ANY",
 ) -> Optional[float]:
     """Extract the most recent numeric value for a tag in preferred units."""
-    t = facts.get(taxonomy, {}).get(tag)
-    if not t:
-        return None
-    units = t.get("units", {})
-    for unit in units_preference:
-        lst = units.get(unit)
-        if not lst:
-            continue
-        item = _latest_unit_item(lst, prefer_quarterly=prefer_quarterly, frame_preference=frame_preference)
-        if item and "val" in item:
-            try:
-                return float(item["val"])  # raw unit value
-            except Exception:
-                continue
-    return None
+    return _get_fact_with_item(facts, taxonomy, tag, units_preference, prefer_quarterly, frame_preference)[0]
 
 def _get_fact_with_item(
     facts: Dict[str, Any],
@@ -148,15 +406,12 @@ def _get_fact_with_item(
     frame_preference: str = "ANY",
 ) -> Tuple[Optional[float], Optional[Dict[str, Any]], Optional[str]]:
     """Like _get_fact but also returns the chosen item metadata and unit label."""
-    t = facts.get(taxonomy, {}).get(tag)
-    if not t:
-        return None, None, None
-    units = t.get("units", {})
+    index = _index_facts(facts)
     for unit in units_preference:
-        lst = units.get(unit)
-        if not lst:
+        series = index.series(taxonomy, tag, unit)
+        if series is None:
             continue
-        item = _latest_unit_item(lst, prefer_quarterly=prefer_quarterly, frame_preference=frame_preference)
+        item = series.items[_pick_latest(series, prefer_quarterly, frame_preference)]
         if item and "val" in item:
             try:
                 val = float(item["val"])  # raw units
@@ -167,89 +422,116 @@ def _get_fact_with_item(
 
 
 def parse_core_metrics(companyfacts: Dict[str, Any], flow_frame_pref: str = "ANY") -> Dict[str, Any]:
-    """Parse a subset of standardized metrics (return values mostly in millions)."""
-    facts = companyfacts.get("facts", {})
+    """Parse a subset of standardized metrics (return values mostly in millions).
+
+    Shares its fact scan with parse_core_metrics_with_meta but keeps this function's own
+    selection rules (see _LEGACY_SELECTION): a reported zero falls through to the next
+    tag, components are scaled to millions before they are summed, and cash and total
+    debt default to 0.0 so net debt is always computed.
+    """
+    found = _scan_core_facts(companyfacts.get("facts", {}), flow_frame_pref, legacy=True)
 
-    def usd(tag: str, prefer_quarterly: bool = True, frame_pref: str = "ANY") -> Optional[float]:
-        v = _get_fact(facts, "us-gaap", tag, ["USD"], prefer_quarterly=prefer_quarterly, frame_preference=frame_pref)
+    def millions(name: str) -> Optional[float]:
+        v = found[name][0]
         return (v / 1_000_000.0) if v is not None else None
 
-    # Core GAAP facts (in millions where applicable)
-    net_income = usd("NetIncomeLoss", prefer_quarterly=True, frame_pref=flow_frame_pref)
-    interest_expense = usd("InterestExpense", prefer_quarterly=True, frame_pref=flow_frame_pref)
-    shareholder_equity = (usd("StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest")
-                          or usd("StockholdersEquity"))
-    total_assets = usd("Assets", prefer_quarterly=False)
-
-    # Debt components
-    debt_current = usd("DebtCurrent", prefer_quarterly=False) or 0.0
-    debt_longterm = (usd("LongTermDebtNoncurrent")
-                     or usd("LongTermDebt", prefer_quarterly=False)
-                     or 0.0)
-    total_debt = (debt_current or 0.0) + (debt_longterm or 0.0)
-    cash = usd("CashAndCashEquivalentsAtCarryingValue", prefer_quarterly=False) or 0.0
-    net_debt = (total_debt - cash) if (total_debt is not None and cash is not None) else None
+    debt_current = millions("debt_current") or 0.0
+    debt_longterm = millions("debt_longterm") or 0.0
+    total_debt = debt_current + debt_longterm
+    cash = millions("cash") or 0.0
 
     # EBITDA proxy: Operating Income + D&A
-    operating_income = usd("OperatingIncomeLoss", prefer_quarterly=True, frame_pref=flow_frame_pref)
-    dda = usd("DepreciationDepletionAndAmortization", prefer_quarterly=True, frame_pref=flow_frame_pref)
-    ebitda = None
-    if operating_income is not None and dda is not None:
-        ebitda = operating_income + dda
-
-    # Shares outstanding (in millions)
-    shares = _get_fact(facts, "dei", "EntityCommonStockSharesOutstanding", ["shares"]) or \
-             _get_fact(facts, "us-gaap", "CommonStockSharesOutstanding", ["shares"]) or None
-    shares_outstanding = (shares / 1_000_000.0) if shares is not None else None
+    operating_income = millions("operating_income")
+    dda = millions("dda")
+    ebitda = (operating_income + dda) if (operating_income is not None and dda is not None) else None
 
     return {
         "ebitda": ebitda,  # millions
-        "net_debt": net_debt,  # millions
-        "net_income": net_income,  # millions
-        "shareholder_equity": shareholder_equity,  # millions
-        "interest_expense": interest_expense,  # millions
-        "total_assets": total_assets,  # millions
-        "shares_outstanding": shares_outstanding,  # millions of shares
+        "net_debt": total_debt - cash,  # millions
+        "net_income": millions("net_income"),  # millions
+        "shareholder_equity": millions("shareholder_equity"),  # millions
+        "interest_expense": millions("interest_expense"),  # millions
+        "total_assets": millions("total_assets"),  # millions
+        "shares_outstanding": millions("shares_outstanding") or None,  # millions of shares
         "cash": cash,  # millions
         "total_debt": total_debt,  # millions
     }
 
+# Facts read by parse_core_metrics(_with_meta):
+# (field, (taxonomy, tag) alternatives in order, units, prefer_quarterly, frame preference)
+# A frame preference of None means the caller's flow_frame_pref.
+_METRIC_SPEC: Tuple[Tuple[str, Tuple[Tuple[str, str], ...], Tuple[str, ...], bool, Optional[str]], ...] = (
+    ("net_income", (("us-gaap", "NetIncomeLoss"),), ("USD",), True, None),
+    ("interest_expense", (("us-gaap", "InterestExpense"),), ("USD",), True, None),
+    ("shareholder_equity", (("us-gaap", "StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest"),
+                            ("us-gaap", "StockholdersEquity")), ("USD",), False, None),
+    ("total_assets", (("us-gaap", "Assets"),), ("USD",), False, None),
+    ("debt_current", (("us-gaap", "DebtCurrent"),), ("USD",), False, None),
+    ("debt_longterm", (("us-gaap", "LongTermDebtNoncurrent"), ("us-gaap", "LongTermDebt")), ("USD",), False, None),
+    ("cash", (("us-gaap", "CashAndCashEquivalentsAtCarryingValue"),), ("USD",), False, None),
+    ("operating_income", (("us-gaap", "OperatingIncomeLoss"),), ("USD",), True, None),
+    ("dda", (("us-gaap", "DepreciationDepletionAndAmortization"),), ("USD",), True, None),
+    ("shares_outstanding", (("dei", "EntityCommonStockSharesOutstanding"),
+                            ("us-gaap", "CommonStockSharesOutstanding")), ("shares",), True, "ANY"),
+)
+
+# parse_core_metrics ranks these tags as flow metrics over any frame, unlike the spec above
+_LEGACY_SELECTION: Dict[Tuple[str, str], Tuple[bool, str]] = {
+    ("us-gaap", "StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest"): (True, "ANY"),
+    ("us-gaap", "StockholdersEquity"): (True, "ANY"),
+    ("us-gaap", "LongTermDebtNoncurrent"): (True, "ANY"),
+}
+
+
+def _scan_core_facts(
+    facts: Dict[str, Any], flow_frame_pref: str, legacy: bool = False
+) -> Dict[str, Tuple[Optional[float], Optional[Dict[str, Any]], Optional[str]]]:
+    """Raw value, item and unit per _METRIC_SPEC field, from the first alternative tag with a value.
+
+    With ``legacy`` the parse_core_metrics rules apply: _LEGACY_SELECTION overrides the
+    ranking and a zero value also moves on to the next alternative.
+    """
+    found: Dict[str, Tuple[Optional[float], Optional[Dict[str, Any]], Optional[str]]] = {}
+    for name, sources, units, prefer_quarterly, frame_pref in _METRIC_SPEC:
+        for taxonomy, tag in sources:
+            quarterly, frame = prefer_quarterly, frame_pref or flow_frame_pref
+            if legacy:
+                quarterly, frame = _LEGACY_SELECTION.get((taxonomy, tag), (quarterly, frame))
+            found[name] = _get_fact_with_item(facts, taxonomy, tag, units, quarterly, frame)
+            if (found[name][0] if legacy else found[name][0] is not None):
+                break
+    return found
+
+
 def parse_core_metrics_with_meta(companyfacts: Dict[str, Any], flow_frame_pref: str = "ANY") -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """Return metrics in millions and per-tag metadata (form, end, frame, unit, raw)."""
     facts = companyfacts.get("facts", {})
 
-    def usd_item(tag: str, prefer_quarterly: bool = True):
-        return _get_fact_with_item(facts, "us-gaap", tag, ["USD"], prefer_quarterly, frame_preference=flow_frame_pref)
-
     def to_millions(v: Optional[float]) -> Optional[float]:
         return (v / 1_000_000.0) if v is not None else None
 
-    # Pull raw values + meta
-    ni_v, ni_item, ni_unit = usd_item("NetIncomeLoss", True)
-    ie_v, ie_item, ie_unit = usd_item("InterestExpense", True)
-    eq_v, eq_item, eq_unit = usd_item("StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest", False)
-    if eq_v is None:
-        eq_v, eq_item, eq_unit = usd_item("StockholdersEquity", False)
-    as_v, as_item, as_unit = usd_item("Assets", False)
-
-    dc_v, dc_item, dc_unit = usd_item("DebtCurrent", False)
-    ld_v, ld_item, ld_unit = usd_item("LongTermDebtNoncurrent", False)
-    if ld_v is None:
-        ld_v, ld_item, ld_unit = usd_item("LongTermDebt", False)
+    # Pull raw values + meta, taking the first alternative tag that has a value
+    found = _scan_core_facts(facts, flow_frame_pref)
+
+    ni_v, ni_item, ni_unit = found["net_income"]
+    ie_v, ie_item, ie_unit = found["interest_expense"]
+    eq_v, eq_item, eq_unit = found["shareholder_equity"]
+    as_v, as_item, as_unit = found["total_assets"]
+
+    dc_v, dc_item, dc_unit = found["debt_current"]
+    ld_v, ld_item, ld_unit = found["debt_longterm"]
     td_v = (dc_v or 0.0) + (ld_v or 0.0) if (dc_v is not None or ld_v is not None) else None
     td_item = ld_item or dc_item
     td_unit = ld_unit or dc_unit
 
-    ca_v, ca_item, ca_unit = usd_item("CashAndCashEquivalentsAtCarryingValue", False)
+    ca_v, ca_item, ca_unit = found["cash"]
     nd_v = (td_v - (ca_v or 0.0)) if (td_v is not None) else None
 
-    oi_v, oi_item, oi_unit = usd_item("OperatingIncomeLoss", True)
-    da_v, da_item, da_unit = usd_item("DepreciationDepletionAndAmortization", True)
+    oi_v, oi_item, oi_unit = found["operating_income"]
+    da_v, da_item, da_unit = found["dda"]
     eb_v = (oi_v + da_v) if (oi_v is not None and da_v is not None) else None
 
-    sh_v, sh_item, sh_unit = _get_fact_with_item(facts, "dei", "EntityCommonStockSharesOutstanding", ["shares"], True)
-    if sh_v is None:
-        sh_v, sh_item, sh_unit = _get_fact_with_item(facts, "us-gaap", "CommonStockSharesOutstanding", ["shares"], True)
+    sh_v, sh_item, sh_unit = found["shares_outstanding"]
 
     metrics = {
         "ebitda": to_millions(eb_v),
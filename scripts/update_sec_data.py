@@ -44,7 +44,7 @@ def main():
         manager = create_data_manager(data_dir, args.user_agent)
 
         # Get initial status
-        initial_status = manager.get_data_status()
+        initial_status = manager.get_data_summary()
         print("📊 Initial Status:")
         print(f"  Total companies: {initial_status['total_companies']}")
         print(f"  Companies with data: {initial_status['companies_with_data']}")
@@ -125,8 +125,7 @@ def main():
             ]
         }
 
-        with open(results_file, 'w') as f:
-            json.dump(results_data, f, indent=2)
+        results_file.write_text(json.dumps(results_data, indent=2), encoding='utf-8')
 
         print(f"\n💾 Results saved to: {results_file}")
 
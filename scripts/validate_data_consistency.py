@@ -155,7 +155,7 @@ def validate_mappings():
     mappings_path = Path(__file__).parent.parent / "data" / "mappings.yaml"
     try:
         with open(mappings_path, 'r') as f:
-            mappings = yaml.safe_load(f)
+            mappings = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     except Exception as e:
         print(f"❌ Error loading mappings: {e}")
         return ["Mappings file error"]
@@ -3,7 +3,8 @@ Tests for citation functionality.
 """
 
 import pytest
-from core.cite import Citation, CitationManager, create_citation_from_match
+from dataclasses import FrozenInstanceError
+from core.cite import MAX_PREVIEW_CHARS, Citation, CitationManager, create_citation_from_match
 
 
 class TestCitation:
@@ -106,6 +107,22 @@ class TestCitationManager:
         assert all_citations["KPI1"] == citation1
         assert all_citations["KPI2"] == citation2
 
+    def test_get_all_citations_is_read_only_view(self):
+        """Test that get_all_citations exposes a live, read-only view."""
+        manager = CitationManager()
+        citation = Citation(doc_id="doc1.pdf", page=1, span=[0, 10], text_preview="Text 1")
+
+        view = manager.get_all_citations()
+        manager.add_citation("KPI1", citation)
+        assert view["KPI1"] == citation
+
+        with pytest.raises(TypeError):
+            view["KPI2"] = citation
+
+        snapshot = manager.snapshot()
+        snapshot["KPI2"] = citation
+        assert manager.get_citation("KPI2") is None
+
     def test_clear_citations(self):
         """Test clearing all citations."""
         manager = CitationManager()
@@ -119,7 +136,7 @@ class TestCitationManager:
         assert len(manager.get_all_citations()) == 0
 
     def test_citation_immutability(self):
-        """Test that retrieved citations are not references to internal objects."""
+        """Test that retrieved citations cannot be modified in place."""
         manager = CitationManager()
 
         original_citation = Citation(
@@ -134,16 +151,11 @@ class TestCitationManager:
         retrieved = manager.get_citation("TEST")
         assert retrieved == original_citation
 
-        # Modify retrieved citation
-        retrieved.page = 999
-
-        # Original should be unchanged (depending on implementation)
-        # This tests whether we return copies or references
-        stored = manager.get_citation("TEST")
+        # Citations are frozen value objects
+        with pytest.raises(FrozenInstanceError):
+            retrieved.page = 999
 
-        # If we return references, this will fail
-        if stored.page != original_citation.page:
-            pytest.skip("CitationManager returns mutable references")
+        assert manager.get_citation("TEST").page == 1
 
 
 class TestCreateCitationFromMatch:
@@ -247,6 +259,24 @@ class TestCreateCitationFromMatch:
         assert citation.text_preview == "EBITDA"
         assert citation.span == (0, 6)
 
+    def test_span_aligned_after_whitespace_trim(self):
+        """Test that the span indexes the match within the trimmed preview."""
+        text = "    \n   Net Debt was $18,750 million.   \n  "
+        start = text.index("$18,750")
+        end = start + len("$18,750")
+
+        citation = create_citation_from_match(
+            doc_id="test.txt",
+            page=1,
+            text=text,
+            start_pos=start,
+            end_pos=end,
+            context_chars=40
+        )
+
+        assert citation.text_preview == "Net Debt was $18,750 million."
+        assert citation.text_preview[citation.span[0]:citation.span[1]] == "$18,750"
+
     def test_large_context_request(self):
         """Test handling of large context requests."""
         text = "This is a test document with some financial information about EBITDA."
@@ -267,6 +297,18 @@ class TestCreateCitationFromMatch:
         assert citation.span[0] >= 0
         assert citation.span[1] <= len(text)
 
+    def test_preview_capped_for_long_match(self):
+        """A match spanning a long stretch of text yields a bounded preview."""
+        text = "Intro. EBITDA " + "filler " * 200 + "$3,450 million. Tail."
+        start = text.index("EBITDA")
+        end = text.index(" million") + len(" million")
+
+        citation = create_citation_from_match("long.txt", 1, text, start, end, context_chars=1000)
+
+        assert len(citation.text_preview) == MAX_PREVIEW_CHARS
+        assert citation.text_preview[citation.span[0]:].startswith("EBITDA filler")
+        assert citation.span[1] == len(citation.text_preview)
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,51 @@
+"""
+Tests for centralized financial configuration loading.
+"""
+
+import shutil
+from pathlib import Path
+
+from core.config import FinancialConfig
+
+
+DEFAULT_CONFIG = Path(__file__).parent.parent / "data" / "default_financial_inputs.yaml"
+
+
+def test_config_reloads_after_file_change(tmp_path):
+    config_path = tmp_path / "inputs.yaml"
+    shutil.copy(DEFAULT_CONFIG, config_path)
+
+    first = FinancialConfig(config_path)
+    second = FinancialConfig(config_path)
+    # Unchanged file is parsed once and shared
+    assert first._config is second._config
+
+    text = config_path.read_text(encoding="utf-8")
+    config_path.write_text(text.replace("beta: ", "beta: 1.5 #", 1), encoding="utf-8")
+
+    updated = FinancialConfig(config_path)
+    assert updated._config is not first._config
+    assert updated.market_assumptions.beta == 1.5
+
+
+def test_model_properties_are_memoized():
+    config = FinancialConfig()
+    assert config.financial_data is config.financial_data
+    assert config.market_assumptions is config.market_assumptions
+
+    cached = config.financial_data
+    config._load_config()
+    assert config.financial_data is not cached
+    assert config.financial_data == cached
+
+
+def test_validate_consistency_metrics():
+    config = FinancialConfig()
+    result = config.validate_consistency()
+    financial = config.financial_data
+
+    assert result['valid'] is True
+    metrics = result['metrics']
+    assert metrics['total_capital'] == financial.net_debt + financial.shareholder_equity
+    assert metrics['debt_to_equity'] == financial.net_debt / financial.shareholder_equity
+    assert metrics['interest_coverage'] == financial.ebitda / financial.interest_expense
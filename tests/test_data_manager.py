@@ -0,0 +1,213 @@
+"""
+Tests for SEC data manager bookkeeping (offline; no SEC requests are made).
+"""
+
+import asyncio
+import json
+import shutil
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import httpx
+import pytest
+
+from core.data_manager import FilingMetadata, SECDataManager
+from core.edgar_client import SECEdgarClient
+
+
+def make_manager(tmp_path):
+    (tmp_path / "filings").mkdir()
+    return SECDataManager(data_dir=tmp_path)
+
+
+def test_metadata_round_trip(tmp_path):
+    manager = make_manager(tmp_path)
+    manager.metadata["PPL"] = FilingMetadata(
+        ticker="PPL",
+        form_type="10-Q",
+        filing_date="2024-08-01",
+        accession_number="0000922224-24-000123",
+        last_updated="2024-08-02T10:00:00",
+        data_quality="good",
+        last_updated_ts=1722592800.0,
+    )
+    manager._save_metadata()
+
+    reloaded = SECDataManager(data_dir=tmp_path)
+    assert reloaded.metadata == manager.metadata
+    assert '\n  "PPL": {' in (tmp_path / "filing_metadata.json").read_text()
+
+
+def test_response_caches_live_under_data_dir(tmp_path):
+    manager = make_manager(tmp_path)
+    assert manager.sec_client.cache_dir == tmp_path / "edgar_cache"
+    assert manager.xbrl_client.cache_dir == tmp_path / "xbrl_cache"
+
+
+def test_update_all_companies_keeps_order_and_saves_once(tmp_path, monkeypatch):
+    manager = make_manager(tmp_path)
+    tickers = list(manager.sec_client.company_ciks)
+
+    saves = []
+
+    def fake_update(ticker, force=False, defer_save=False):
+        assert defer_save
+        if ticker == tickers[1]:
+            raise RuntimeError("boom")
+        return ticker
+
+    monkeypatch.setattr(manager, "update_company_data", fake_update)
+    monkeypatch.setattr(manager, "_save_metadata", lambda: saves.append(1))
+    results = manager.update_all_companies()
+
+    assert [getattr(r, "ticker", r) for r in results] == tickers
+    assert results[1].success is False and results[1].error_message == "boom"
+    assert saves == [1]
+
+
+def test_legacy_metadata_gets_epoch_timestamp(tmp_path):
+    updated = datetime.now() - timedelta(days=40)
+    (tmp_path / "filing_metadata.json").write_text(json.dumps({"PPL": {
+        "ticker": "PPL",
+        "form_type": "10-Q",
+        "filing_date": "2024-08-01",
+        "accession_number": "0000922224-24-000123",
+        "last_updated": updated.isoformat(),
+        "data_quality": "good",
+    }}))
+
+    manager = make_manager(tmp_path)
+
+    assert manager.metadata["PPL"].last_updated_ts == updated.timestamp()
+    assert json.loads((tmp_path / "filing_metadata.json").read_text())["PPL"]["last_updated_ts"] == updated.timestamp()
+    assert manager.check_for_updates("PPL", days_threshold=30)
+    assert not manager.check_for_updates("PPL", days_threshold=41)
+    assert manager.get_data_status()["companies"]["PPL"]["days_since_update"] == 40
+
+    summary = manager.get_data_summary()
+    assert summary["companies_with_data"] == 1
+    assert summary["total_companies"] == len(manager.sec_client.company_ciks)
+
+
+class FakeSECClient:
+    company_ciks = {"PPL": "0000922224"}
+
+    def __init__(self):
+        self.calls = []
+
+    def get_latest_periodic(self, ticker):
+        self.calls.append("periodic")
+        return {"accession_number": "0000922224-24-000123", "primary_document": "ppl-10q.htm",
+                "filing_date": "2024-08-01", "form_type": "10-Q"}
+
+    def get_filing_content(self, accession_number, primary_document):
+        self.calls.append("content")
+        return "Item 2. Management's Discussion and Analysis\nAdjusted EBITDA increased to $3,450 million"
+
+
+@pytest.fixture
+def manager_with_mappings(tmp_path):
+    shutil.copy(Path(__file__).parent.parent / "data" / "mappings.yaml", tmp_path / "mappings.yaml")
+    manager = make_manager(tmp_path)
+    manager.sec_client = FakeSECClient()
+    return manager
+
+
+def test_latest_filing_is_fetched_once_for_update_and_read(manager_with_mappings):
+    manager = manager_with_mappings
+
+    result = manager.update_company_data("PPL")
+    data = manager.get_latest_financial_data("PPL")
+
+    assert result.success and result.metrics_extracted == 1
+    assert data["kpis"]["EBITDA"]["value"] == 3450.0
+    assert data["kpis"]["EBITDA"]["citation"]["doc_id"] == "0000922224-24-000123"
+    assert manager.sec_client.calls == ["periodic", "content"]
+
+    manager.update_company_data("PPL", force=True)
+    assert manager.sec_client.calls == ["periodic", "content"] * 2
+
+
+def test_latest_financial_data_reuses_kpi_sidecar(tmp_path, manager_with_mappings, monkeypatch):
+    manager = manager_with_mappings
+    manager.update_company_data("PPL")
+
+    sidecar = tmp_path / "filings" / "PPL_0000922224-24-000123.kpis.json"
+    assert sidecar.exists()
+
+    def no_extract(*args):
+        raise AssertionError("extraction should be served from the sidecar cache")
+
+    monkeypatch.setattr(manager, "_extract_kpis", no_extract)
+    data = manager.get_latest_financial_data("PPL")
+    assert data["kpis"]["EBITDA"]["value"] == 3450.0
+    assert data["kpis"]["EBITDA"]["citation"]["doc_id"] == "0000922224-24-000123"
+
+    # Editing mappings.yaml invalidates sidecars extracted with the old patterns
+    extracted = []
+    monkeypatch.setattr(manager, "_extract_kpis", lambda *args: extracted.append(args) or {})
+    manager.mappings_digest = "edited"
+    assert manager.get_latest_financial_data("PPL")["kpis"] == {}
+    assert len(extracted) == 1
+    manager.get_latest_financial_data("PPL")
+    assert len(extracted) == 1
+
+
+def test_validate_data_quality_counts_required_metrics(tmp_path, monkeypatch):
+    manager = make_manager(tmp_path)
+    kpis = {"EBITDA": {}, "NetDebt": {}, "FFO": {}}
+    monkeypatch.setattr(manager, "get_latest_financial_data",
+                        lambda ticker: {"kpis": kpis, "filing_date": date.today().isoformat()})
+
+    report = manager.validate_data_quality("PPL")
+
+    assert report["metrics"]["required_metrics_found"] == 2
+    assert report["metrics"]["required_metrics_total"] == 3
+    assert report["overall_quality"] == "fair"
+
+
+def test_update_all_companies_extracts_in_worker_processes(manager_with_mappings):
+    manager = manager_with_mappings
+    manager.sec_client.company_ciks = {"PPL": "0000922224", "TRP": "0001232384"}
+
+    results = manager.update_all_companies(force=True)
+
+    assert [r.ticker for r in results] == ["PPL", "TRP"]
+    expected = [len(manager.kpi_extractor.extract_from_text(FakeSECClient().get_filing_content(None, None), t, "x"))
+                for t in ("PPL", "TRP")]
+    assert all(r.success for r in results)
+    assert [r.metrics_extracted for r in results] == expected
+    assert manager._extract_pool is None
+
+
+def test_async_update_all_companies_over_httpx(tmp_path, manager_with_mappings):
+    manager = manager_with_mappings
+    manager.sec_client = SECEdgarClient("test-agent", cache_dir=tmp_path / "edgar")
+    manager.sec_client.REQUEST_BURST = manager.sec_client._tokens = 1000
+    tickers = list(manager.sec_client.company_ciks)
+
+    def handler(request):
+        assert request.headers["User-Agent"] == "test-agent"
+        if "/submissions/" in request.url.path:
+            cik = request.url.path.rsplit("CIK", 1)[1][:10]
+            return httpx.Response(200, json={"filings": {"recent": {
+                "form": ["10-Q"],
+                "filingDate": [date.today().isoformat()],
+                "accessionNumber": [f"{cik}-25-000001"],
+                "primaryDocument": ["q.htm"],
+            }}})
+        return httpx.Response(200, text="<html><body><p>Item 2. Management's Discussion and Analysis</p>"
+                                        "<p>Adjusted EBITDA increased to $3,450 million</p></body></html>",
+                              headers={"Content-Type": "text/html; charset=utf-8"})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            return await manager.aupdate_all_companies(http)
+
+    results = asyncio.run(run())
+
+    assert [r.ticker for r in results] == tickers
+    assert all(r.success for r in results)
+    assert results[tickers.index("PPL")].metrics_extracted == 1
+    assert set(json.loads((tmp_path / "filing_metadata.json").read_text())) == set(tickers)
+    assert manager._extract_pool is None
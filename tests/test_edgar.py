@@ -0,0 +1,210 @@
+"""
+Tests for SEC EDGAR client helpers (offline, no network access).
+"""
+
+import json
+
+from core import edgar_client
+from core.edgar_client import _html_to_text
+
+
+SAMPLE_HTML = """
+<html><head><style>p { color: red; }</style><script>var x = 1;</script></head>
+<body><p>Adjusted EBITDA was <b>$3,450</b> million.</p>
+<div>Net   Debt
+was $18,750 million.</div></body></html>
+"""
+
+
+def test_html_to_text_strips_markup():
+    text = _html_to_text(SAMPLE_HTML)
+    assert "color" not in text
+    assert "var x" not in text
+    assert "<" not in text
+    assert "Adjusted EBITDA was $3,450 million." in text
+    assert "Net Debt was $18,750 million." in text
+
+
+def test_html_to_text_regex_fallback(monkeypatch):
+    monkeypatch.setattr(edgar_client, "HTMLParser", None)
+    text = _html_to_text(SAMPLE_HTML)
+    assert "var x" not in text
+    assert "Adjusted EBITDA was $3,450 million." in text
+
+
+def test_html_to_text_accepts_bytes(monkeypatch):
+    raw = SAMPLE_HTML.encode("utf-8")
+    assert "Adjusted EBITDA was $3,450 million." in _html_to_text(raw)
+
+    monkeypatch.setattr(edgar_client, "HTMLParser", None)
+    assert "Adjusted EBITDA was $3,450 million." in _html_to_text(raw, "utf-8")
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode("utf-8")
+
+    def json(self):
+        return self._payload
+
+    encoding = "utf-8"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def iter_content(self, chunk_size=None):
+        yield self._payload.encode("utf-8") if isinstance(self._payload, str) else self.content
+
+
+class FakeSession:
+    """Minimal stand-in for requests.Session that records requested URLs."""
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.urls = []
+        self.headers = {}
+
+    def get(self, url, params=None, timeout=None, **kwargs):
+        self.urls.append(url)
+        return FakeResponse(self.payload)
+
+
+SUBMISSIONS = {
+    "filings": {
+        "recent": {
+            "form": ["10-Q", "8-K", "10-K", "10-Q"],
+            "filingDate": ["2024-08-01", "2024-06-15", "2024-02-20", "2023-11-02"],
+            "accessionNumber": ["0000922224-24-000010", "0000922224-24-000008",
+                                "0000922224-24-000003", "0000922224-23-000020"],
+            "primaryDocument": ["q2.htm", "8k.htm", "10k.htm", "q3.htm"],
+        }
+    }
+}
+
+
+def make_client(tmp_path):
+    client = edgar_client.SECEdgarClient("test-agent", cache_dir=tmp_path)
+    client.session = FakeSession(SUBMISSIONS)
+    client.REQUEST_BURST = client._tokens = 1000  # tests never wait on the rate limiter
+    return client
+
+
+def test_submissions_cached_in_memory_and_on_disk(tmp_path):
+    client = make_client(tmp_path)
+
+    client.get_company_filings("PPL", ["10-Q"], start_date="2023-01-01", end_date="2024-12-31")
+    client.get_company_filings("PPL", ["10-K"], start_date="2023-01-01", end_date="2024-12-31")
+    assert len(client.session.urls) == 1
+    assert (tmp_path / "submissions_0000922224.json").exists()
+
+    # A fresh client picks the document up from disk without a request
+    cold = make_client(tmp_path)
+    filings = cold.get_company_filings("PPL", ["10-Q", "10-K"], start_date="2023-01-01", end_date="2024-12-31")
+    assert cold.session.urls == []
+    assert [f["filing_date"] for f in filings] == ["2024-08-01", "2024-02-20", "2023-11-02"]
+
+
+def test_date_window_on_descending_dates():
+    dates = ["2024-08-01", "2024-06-15", "2024-02-20", "2023-11-02", "2022-05-01"]
+    assert edgar_client._date_window(dates, "2023-01-01", "2024-12-31") == (0, 4)
+    assert edgar_client._date_window(dates, "2024-02-20", "2024-06-15") == (1, 3)
+    assert edgar_client._date_window(dates, "2025-01-01", "2025-12-31") == (0, 0)
+    assert edgar_client._date_window([], "2023-01-01", "2024-12-31") == (0, 0)
+
+
+def test_get_company_filings_respects_window(tmp_path):
+    client = make_client(tmp_path)
+    filings = client.get_company_filings("PPL", ["10-Q", "10-K"], start_date="2024-01-01", end_date="2024-07-01")
+    assert [(f["form_type"], f["filing_date"]) for f in filings] == [("10-K", "2024-02-20")]
+    assert filings[0]["accession_number"] == "0000922224-24-000003"
+
+
+def test_get_filing_metadata_splits_forms(tmp_path):
+    client = make_client(tmp_path)
+    meta = client.get_filing_metadata("PPL")
+    assert meta["latest_10q"]["filing_date"] == "2024-08-01"
+    assert meta["latest_10k"]["filing_date"] == "2024-02-20"
+    assert meta["total_filings"] == 3
+    assert len(client.session.urls) == 1
+
+
+def test_get_latest_periodic_picks_newest_form(tmp_path):
+    from datetime import date, timedelta
+
+    today = date.today()
+    recent = {"filings": {"recent": {
+        "form": ["10-K", "8-K", "10-Q"],
+        "filingDate": [(today - timedelta(days=d)).isoformat() for d in (10, 40, 100)],
+        "accessionNumber": ["0000922224-25-000003", "0000922224-25-000002", "0000922224-25-000001"],
+        "primaryDocument": ["10k.htm", "8k.htm", "q3.htm"],
+    }}}
+    client = make_client(tmp_path)
+    client.session = FakeSession(recent)
+
+    filing = client.get_latest_periodic("PPL")
+
+    assert filing["form_type"] == "10-K"
+    assert filing["accession_number"] == "0000922224-25-000003"
+    assert len(client.session.urls) == 1
+
+
+def test_rate_limit_token_bucket(tmp_path, monkeypatch):
+    client = make_client(tmp_path)
+    client.REQUEST_RATE = 8.0
+    client.REQUEST_BURST = 2
+    clock = {"now": 100.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(round(seconds, 6))
+        clock["now"] += seconds
+
+    monkeypatch.setattr(edgar_client.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(edgar_client.time, "sleep", fake_sleep)
+
+    client._rate_limit()  # burst allowance: no wait
+    client._rate_limit()
+    client._rate_limit()  # bucket empty: waits for one token
+    clock["now"] += 1.0
+    client._rate_limit()  # refilled after idling: no wait
+    client._rate_limit()
+
+    assert sleeps == [0.125]
+
+
+def test_extract_mdna_section():
+    content = ("Cover page. Item 2. Management's Discussion and Analysis "
+               "Adjusted EBITDA was $3,450 million. Item 3. Quantitative and Qualitative Disclosures")
+    assert edgar_client._extract_mdna(content) == "Adjusted EBITDA was $3,450 million. Item 3."
+    assert edgar_client._extract_mdna("No section headings here") is None
+    assert edgar_client._extract_mdna("MD&A without a closing heading") is None
+
+
+def test_extract_mdna_bounded_window(monkeypatch):
+    monkeypatch.setattr(edgar_client, "MDA_WINDOW_CHARS", 20)
+    content = "MD&A " + "x" * 50 + " FINANCIAL STATEMENTS"
+    assert edgar_client._extract_mdna(content) is None
+
+
+def test_filing_content_cached_on_disk(tmp_path):
+    client = make_client(tmp_path)
+    client.session = FakeSession(SAMPLE_HTML)
+
+    text = client.get_filing_content("0000922224-24-000010", "q2.htm")
+    assert "Adjusted EBITDA was $3,450 million." in text
+    assert len(client.session.urls) == 1
+    assert (tmp_path / "content" / "000092222424000010_q2.htm.txt.gz").exists()
+
+    cold = make_client(tmp_path)
+    assert cold.get_filing_content("0000922224-24-000010", "q2.htm") == text
+    assert cold.session.urls == []
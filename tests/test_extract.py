@@ -2,6 +2,8 @@
 Tests for KPI extraction functionality.
 """
 
+import re
+
 import pytest
 import tempfile
 from pathlib import Path
@@ -121,9 +123,9 @@ class TestKPIExtractor:
         content = "Adjusted EBITDA was $4.2 billion for the quarter."
         pattern = r"Adjusted EBITDA was \$?([0-9,]+(?:\.[0-9]+)?)\s*(?:billion|million)"
 
-        value, citation = extractor._extract_single_kpi(
+        value, citation, match_text = extractor._extract_single_kpi(
             content=content,
-            pattern=pattern,
+            regex=re.compile(pattern, re.IGNORECASE | re.MULTILINE),
             doc_id="test.txt",
             unit="USD millions",
             normalize="strip_commas",
@@ -131,6 +133,7 @@ class TestKPIExtractor:
 
         assert value == 4200.0
         assert citation is not None
+        assert match_text == "Adjusted EBITDA was $4.2 billion"
 
     def test_us_interest_expense_net_billion(self):
         """US issuer interest expense, net in billions normalizes to millions."""
@@ -155,6 +158,75 @@ class TestKPIExtractor:
         finally:
             p.unlink()
 
+    def test_prefer_term_absent_takes_first_match(self, monkeypatch):
+        """Without the prefer term in the document, no pattern runs after the first match."""
+        extractor = KPIExtractor(self.mappings_path)
+        content = "EBITDA increased to $3,120 million. EBITDA of $2,980 million."
+        calls = []
+        original = extractor._extract_single_kpi
+
+        def counting(content, regex, *args):
+            calls.append(regex.pattern)
+            return original(content, regex, *args)
+
+        monkeypatch.setattr(extractor, "_extract_single_kpi", counting)
+        kpis = extractor.extract_from_text(content, "PPL", "doc")
+
+        assert kpis["EBITDA"].value == 3120.0
+        ebitda_patterns = [p for p, _ in extractor.mappings["PPL"]["EBITDA"].patterns]
+        assert [p for p in calls if p in ebitda_patterns] == ebitda_patterns[:1]
+
+    def test_fused_patterns(self):
+        """Each KPI's patterns are fused into one alternation unless they use backreferences."""
+        extractor = KPIExtractor(self.mappings_path)
+
+        fused = extractor.mappings["PPL"]["EBITDA"].fused
+        assert fused.search(self.sample_text).start() == self.sample_text.index("EBITDA increased")
+        assert KPIExtractor._fuse_patterns([r"(\d+) and \1"]) is None
+        assert KPIExtractor._fuse_patterns([]) is None
+
+    def test_anchor_prefilter(self, tmp_path, monkeypatch):
+        """KPIs whose anchor literals never occur are skipped before any regex runs."""
+        from core.extract import _required_literal
+
+        assert _required_literal(r"Net Debt[s]? of \$?([0-9,]+)") == "net debt"
+        assert _required_literal(r"EBITDA|Earnings") == ""
+        # Escapes whose payload is not literal text, and non-quantifier braces, give no anchor
+        for pattern in (r"Net\x20Debt\s*([0-9,]+)", r"\101BCD", r"FFO\N{NO-BREAK SPACE}total",
+                        r"(?:EBITDA){e<=1}\s+([0-9,]+)", r"Net\u0020Debt", r"EBITDA{x}"):
+            assert _required_literal(pattern) == "", pattern
+
+        mappings = tmp_path / "anchors.yaml"
+        mappings.write_text(
+            "PPL:\n"
+            "  EBITDA:\n"
+            "    patterns: ['\\$([0-9,]+) of EBITDA']\n"
+            "    unit: USD millions\n"
+            "    anchors: [EBITDA, Earnings]\n"
+        )
+        extractor = KPIExtractor(mappings)
+        assert extractor.mappings["PPL"]["EBITDA"].anchors == ("ebitda", "earnings")
+
+        calls = []
+        original = extractor._extract_single_kpi
+        monkeypatch.setattr(
+            extractor, "_extract_single_kpi", lambda *args: calls.append(args) or original(*args)
+        )
+        assert extractor.extract_from_text("$1,200 of revenue", "PPL", "doc") == {}
+        assert calls == []
+        assert extractor.extract_from_text("$1,200 of ebitda", "PPL", "doc")["EBITDA"].value == 1200.0
+
+    def test_malformed_mappings_rejected_at_load(self, tmp_path):
+        """Malformed KPI entries fail when the mappings load, not mid-extraction."""
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("PPL:\n  EBITDA: not-a-mapping\n")
+        with pytest.raises(TypeError):
+            KPIExtractor(bad)
+
+        config = KPIExtractor(self.mappings_path).mappings["PPL"]["EBITDA"]
+        with pytest.raises(AttributeError):
+            config.unit = "USD"
+
     def test_citation_creation(self):
         """Test citation creation."""
         extractor = KPIExtractor(self.mappings_path)
@@ -170,6 +242,72 @@ class TestKPIExtractor:
         assert citation.span[0] < citation.span[1]
         assert "EBITDA" in citation.text_preview
 
+    def test_extract_from_text_matches_file(self):
+        """In-memory extraction gives the same KPIs as the file path, cited by doc_id."""
+        extractor = KPIExtractor(self.mappings_path)
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            f.write(self.sample_text)
+            temp_path = Path(f.name)
+
+        try:
+            from_file = extractor.extract_from_file(temp_path, "PPL")
+        finally:
+            temp_path.unlink()
+
+        from_text = extractor.extract_from_text(self.sample_text, "PPL", temp_path.name)
+        assert from_text == from_file
+        assert from_text["EBITDA"].citation.doc_id == temp_path.name
+
+    def test_file_content_cached_until_file_changes(self, tmp_path):
+        """Repeated reads reuse the cached text; rewriting the file invalidates it."""
+        extractor = KPIExtractor(self.mappings_path)
+        path = tmp_path / "ppl_filing.txt"
+        path.write_text(self.sample_text)
+
+        first = extractor._read_file_content(path)
+        assert KPIExtractor(self.mappings_path)._read_file_content(path) is first
+
+        path.write_text(self.sample_text + "\nDPS of $1.05")
+        assert extractor._read_file_content(path).endswith("DPS of $1.05")
+
+    def test_uncached_read_leaves_cache_alone(self, tmp_path):
+        """One-shot reads (e.g. temp uploads) do not occupy read-cache entries."""
+        from core.extract import _TEXT_CACHE, _clear_text_cache
+
+        extractor = KPIExtractor(self.mappings_path)
+        path = tmp_path / "upload.txt"
+        path.write_text(self.sample_text)
+
+        _clear_text_cache()
+        kpis = extractor.extract_from_file(path, "PPL", cache=False)
+        assert not _TEXT_CACHE
+        assert kpis == extractor.extract_from_file(path, "PPL")
+        assert list(_TEXT_CACHE) == [str(path)]
+
+        empty = tmp_path / "empty.txt"
+        empty.write_text("")
+        assert extractor._read_file_content(empty, cache=False) == ""
+
+    def test_text_cache_is_bounded_by_characters(self, tmp_path, monkeypatch):
+        """Least recently used documents are evicted to keep the cache under its budget."""
+        import core.extract as extract_module
+
+        monkeypatch.setattr(extract_module, "_TEXT_CACHE_MAX_CHARS", 25)
+        extract_module._clear_text_cache()
+        extractor = KPIExtractor(self.mappings_path)
+        paths = []
+        for name, text in (("a", "x" * 10), ("b", "y" * 10), ("c", "z" * 10), ("big", "w" * 30)):
+            paths.append(tmp_path / f"{name}.txt")
+            paths[-1].write_text(text)
+
+        for path in paths:
+            extractor._read_file_content(path)
+
+        assert list(extract_module._TEXT_CACHE) == [str(p) for p in paths[1:3]]
+        assert extract_module._TEXT_CACHE_CHARS == 20
+        extract_module._clear_text_cache()
+
     def test_deterministic_extraction(self):
         """Test that extraction is deterministic (same input = same output)."""
         extractor = KPIExtractor(self.mappings_path)
@@ -245,6 +383,23 @@ class TestExtractKpisFromFilings:
         else:
             pytest.skip("Test data files not available")
 
+    def test_parallel_extraction_matches_serial(self, tmp_path):
+        """Process-pool extraction gives the same merged result as one file at a time."""
+        mappings_path = Path(__file__).parent.parent / "data" / "mappings.yaml"
+        for i, value in enumerate(["3,120", "3,250", "3,380", "3,450", "3,510"]):
+            (tmp_path / f"ppl_2024_{i}.txt").write_text(f"Adjusted EBITDA increased to ${value} million")
+        (tmp_path / "ppl_2024_bad.txt").write_bytes(b"\xff\xfe not utf-8")
+
+        extractor = KPIExtractor(mappings_path)
+        files = sorted(tmp_path.glob("ppl_*.txt"))
+        parallel = extractor.extract_many(files, "PPL")
+        serial = [extractor._extract_file_or_report(f, "PPL") for f in files]
+
+        assert len(files) >= extractor.PARALLEL_MIN_FILES
+        assert parallel == serial
+        assert parallel[-1] == {}
+        assert extract_kpis_from_filings(tmp_path, mappings_path, "PPL")["EBITDA"].value > 0
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -2,7 +2,12 @@
 Tests for valuation math correctness and robustness.
 """
 
-from core.valuation import ValuationEngine
+import pytest
+from pydantic import ValidationError
+
+from core.valuation import (
+    ValuationEngine, ValuationInputs, ValuationInputsFast, _dcf_kernel, _wacc_kernel,
+)
 from core.config import FinancialConfig
 
 
@@ -59,3 +64,69 @@ def test_wacc_epv_and_dcf_math():
         else:
             assert dcf_value == float('inf')
 
+
+def test_inputs_reject_out_of_range_values():
+    base = {"ebitda": 3450, "net_debt": 18750, "maintenance_capex": 220}
+    assert ValuationInputs(**base, net_income=-50).net_income == -50
+
+    for override in ({"projection_years": 10_000_000}, {"projection_years": 0},
+                     {"ebitda": float("nan")}, {"net_debt": 1e15}, {"tax_rate": 3.0}):
+        with pytest.raises(ValidationError):
+            ValuationInputs(**{**base, **override})
+
+
+def test_kernels_match_engine():
+    engine = ValuationEngine()
+    for growth in (0.02, 0.0764, -1.0):
+        inputs = ValuationInputs(ebitda=3450, net_debt=18750, maintenance_capex=220, terminal_growth=growth)
+        wacc, _, _ = _wacc_kernel(inputs.risk_free_rate, inputs.market_risk_premium, inputs.beta,
+                                  inputs.cost_of_debt, inputs.tax_rate, inputs.debt_weight,
+                                  inputs.equity_weight)
+        assert wacc == engine.calculate_wacc(inputs)
+
+        fcff = (inputs.ebitda - inputs.maintenance_capex) * (1 - inputs.tax_rate)
+        sum_pv, _, pv_terminal = _dcf_kernel(fcff, wacc, growth, inputs.projection_years)
+        dcf = engine.calculate_dcf(inputs)
+        assert abs(sum_pv - sum(dcf["components"]["projected_fcffs"])) <= 1e-9 * max(1.0, abs(sum_pv))
+        assert sum_pv + pv_terminal == dcf["dcf_value"]
+
+
+def test_valuation_batch_matches_scalar():
+    engine = ValuationEngine()
+    rows = [
+        {"ebitda": 3450.0, "net_debt": 18750.0, "maintenance_capex": 220.0, "beta": 0.8, "terminal_growth": 0.02},
+        {"ebitda": 1200.0, "net_debt": 4000.0, "maintenance_capex": 90.0, "beta": 1.1, "terminal_growth": 0.0},
+        {"ebitda": 500.0, "net_debt": -50.0, "maintenance_capex": 40.0, "beta": -0.9, "terminal_growth": 0.01},
+        {"ebitda": 0.0, "net_debt": 100.0, "maintenance_capex": 0.0, "beta": 0.8, "terminal_growth": 0.02},
+    ]
+    batch = engine.calculate_valuation_batch({key: [row[key] for row in rows] for key in rows[0]})
+
+    for i, row in enumerate(rows):
+        results = engine.calculate_valuation(ValuationInputs(**row))
+        assert batch["wacc"][i] == results.wacc
+        assert batch["epv"][i] == results.epv
+        assert batch["dcf_value"][i] == results.dcf_value
+        assert batch["ev_ebitda_ratio"][i] == results.ev_ebitda_ratio
+        assert batch["net_debt_ebitda_ratio"][i] == results.net_debt_ebitda_ratio
+
+    compact = engine.calculate_valuation_batch({key: [row[key] for row in rows] for key in rows[0]}, typecode="f")
+    assert compact["epv"].itemsize == 4
+    assert compact["epv"].tolist() == pytest.approx(batch["epv"].tolist(), rel=1e-6)
+
+    with pytest.raises(ValueError):
+        engine.calculate_valuation_batch({"ebitda": [1.0], "net_debt": [1.0]})
+    with pytest.raises(ValueError):
+        engine.calculate_valuation_batch({"ebitda": [], "net_debt": [], "maintenance_capex": []}, typecode="i")
+    with pytest.raises(ValueError):
+        engine.calculate_valuation_batch({"ebitda": [1.0], "net_debt": [1.0], "maintenance_capex": [1.0, 2.0]})
+
+
+def test_fast_inputs_match_model():
+    inputs = ValuationInputs(ebitda=3450, net_debt=18750, maintenance_capex=220, net_income=900)
+    fast = inputs.to_fast()
+    assert fast == ValuationInputsFast(**inputs.model_dump())
+    assert ValuationInputsFast(3450, 18750, 220).tax_rate == inputs.tax_rate
+
+    engine = ValuationEngine()
+    assert engine.calculate_wacc(fast) == engine.calculate_wacc(inputs)
+    assert engine.calculate_dcf(fast) == engine.calculate_dcf(inputs)
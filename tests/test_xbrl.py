@@ -81,3 +81,125 @@ def test_parse_core_metrics_with_meta():
     assert metrics["net_income"] == 100.0
     assert details["net_income"]["form"] == "10-Q"
     assert details["net_income"]["frame"] == "CY2024Q2QTD"
+
+
+def test_parse_core_metrics_keeps_its_selection_rules():
+    from core.xbrl_client import parse_core_metrics_with_meta
+
+    sample = {
+        "facts": {
+            "us-gaap": {
+                "StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest": {
+                    "units": {"USD": [{"end": "2024-06-30", "val": 0, "form": "10-Q"}]}},
+                "StockholdersEquity": {"units": {"USD": [{"end": "2024-06-30", "val": 5000000, "form": "10-Q"}]}},
+            }
+        }
+    }
+
+    # A reported zero falls through to the next tag here, but is kept by the meta variant
+    assert parse_core_metrics(sample)["shareholder_equity"] == 5.0
+    assert parse_core_metrics_with_meta(sample)[0]["shareholder_equity"] == 0.0
+
+
+def test_facts_index_is_reused_across_frame_preferences():
+    from core.xbrl_client import _index_facts, parse_core_metrics_with_meta
+
+    sample = {
+        "facts": {
+            "us-gaap": {
+                "NetIncomeLoss": {"units": {"USD": [
+                    {"end": "2024-06-30", "val": 200000000, "form": "10-Q", "frame": "CY2024Q2QTD"},
+                    {"end": "2024-06-30", "val": 600000000, "form": "10-Q", "frame": "CY2024Q2YTD"},
+                ]}},
+            }
+        }
+    }
+
+    qtd, _ = parse_core_metrics_with_meta(sample, flow_frame_pref="QTD")
+    index = _index_facts(sample["facts"])
+    ytd, _ = parse_core_metrics_with_meta(sample, flow_frame_pref="YTD")
+
+    assert (qtd["net_income"], ytd["net_income"]) == (200.0, 600.0)
+    assert _index_facts(sample["facts"]) is index
+    assert index.series("us-gaap", "NetIncomeLoss", "USD").picks == {(True, "QTD"): 0, (True, "YTD"): 1}
+
+
+class _FactsResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class _FactsSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+def test_company_facts_cached_in_memory_and_on_disk(tmp_path):
+    import os
+    from core.xbrl_client import XBRLClient
+
+    body = b'{"cik": 922224, "facts": {}}'
+    client = XBRLClient(cache_dir=tmp_path)
+    client.session = _FactsSession([_FactsResponse(200, body, {"ETag": '"v1"'})])
+
+    assert client.get_company_facts("922224") == {"cik": 922224, "facts": {}}
+    assert client.get_company_facts("0000922224")["cik"] == 922224
+    assert len(client.session.calls) == 1
+    assert (tmp_path / "CIK0000922224.json").read_bytes() == body
+
+    # A fresh client reads the raw body from disk without a request
+    other = XBRLClient(cache_dir=tmp_path)
+    other.session = _FactsSession([])
+    assert other.get_company_facts("922224")["cik"] == 922224
+
+    # Once stale, the stored ETag is sent and a 304 reuses the cached body
+    stale = (tmp_path / "CIK0000922224.json")
+    os.utime(stale, (0, 0))
+    revalidating = XBRLClient(cache_dir=tmp_path)
+    revalidating.session = _FactsSession([_FactsResponse(304)])
+    assert revalidating.get_company_facts("922224")["cik"] == 922224
+    assert revalidating.session.calls[0]["If-None-Match"] == '"v1"'
+    assert stale.stat().st_mtime > 0
+
+
+def test_async_company_facts_share_the_disk_cache(tmp_path):
+    import asyncio
+    import httpx
+    from core.xbrl_client import XBRLClient
+
+    body = b'{"cik": 922224, "facts": {}}'
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, content=body, headers={"ETag": '"v1"'})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            first = await XBRLClient(cache_dir=tmp_path).aget_company_facts("922224", http)
+            second = await XBRLClient(cache_dir=tmp_path).aget_company_facts("922224", http)
+            return first, second
+
+    assert asyncio.run(run()) == ({"cik": 922224, "facts": {}},) * 2
+    assert len(calls) == 1
+    assert (tmp_path / "CIK0000922224.json").read_bytes() == body
+
+
+def test_end_key_orders_sec_dates_as_integers():
+    from core.xbrl_client import _end_key
+
+    assert _end_key({"end": "2024-06-30"}) == 20240630
+    assert _end_key({"filed": "2023-12-31"}) == 20231231
+    assert _end_key({"end": "2024-06-30T00:00:00"}) == 20240630
+    assert _end_key({"end": "not-a-date"}) == _end_key({}) == 10101